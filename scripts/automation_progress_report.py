@@ -10,10 +10,14 @@ Usage: python3 automation_progress_report.py [database_path]
 
 import sqlite3
 import argparse
+import functools
+import io
 import json
 import re
 import os
 import shutil
+import string
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
@@ -40,6 +44,115 @@ TEST_TYPE_TAGS = [
 # Users can modify this limit to control how many top tags are displayed
 TOP_TAGS_LIMIT = 20
 
+# Indexes on the join/filter columns used by report queries; PRAGMA user_version records
+# which set has been applied (and analyzed) so they are only created once per database
+REPORT_INDEX_VERSION = 6
+REPORT_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_test_case_tags_tag_id ON test_case_tags(tag_id, test_case_id)",
+    # The UNIQUE index on tags.tag_name is BINARY; priority/type tag lookups compare with NOCASE
+    "CREATE INDEX IF NOT EXISTS idx_tags_name_nocase ON tags(tag_name COLLATE NOCASE)",
+    # Covers test case -> suite joins without touching the link table itself
+    "CREATE INDEX IF NOT EXISTS idx_test_suite_case_links_case_suite ON test_suite_case_links(test_case_db_id, test_suite_id)",
+    "CREATE INDEX IF NOT EXISTS idx_test_suite_case_links_suite_id ON test_suite_case_links(test_suite_id)",
+    "CREATE INDEX IF NOT EXISTS idx_test_suite_collection_links_collection_id ON test_suite_collection_links(collection_suite_id)",
+    # Partial covering index: Dynamic Test Suite criteria lookups read only the index, never the suite rows
+    "DROP INDEX IF EXISTS idx_test_suites_filtering_type",
+    "CREATE INDEX IF NOT EXISTS idx_test_suites_type_filtering_text ON test_suites(suite_type, filtering_text) "
+    "WHERE filtering_text IS NOT NULL AND filtering_text != ''",
+    "CREATE INDEX IF NOT EXISTS idx_test_cases_name ON test_cases(name COLLATE NOCASE)",  # NOCASE serves prefix LIKE
+    "CREATE INDEX IF NOT EXISTS idx_test_cases_path ON test_cases(relative_path)",
+]
+
+# Connection tuning for the read-heavy reporting workload; query_only is applied last
+# because it blocks any further writes (including index setup) on the connection
+REPORT_PRAGMAS = [
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-262144",  # 256 MiB page cache
+    "PRAGMA mmap_size=1073741824",  # Read up to 1 GiB of the file through memory mapping
+    "PRAGMA query_only=ON",
+]
+
+# Report banner lines, shared by every report run
+_MD_REPORT_TITLE = "# 📊 Test Automation Project Statistics Report"
+_MD_REPORT_COMPLETED = "✅ **Automation Progress Report Completed**"
+_CONSOLE_RULE = "=" * 80
+_CONSOLE_REPORT_TITLE = "📊 TEST AUTOMATION PROJECT STATISTICS REPORT"
+_CONSOLE_REPORT_COMPLETED = "✅ AUTOMATION PROGRESS REPORT COMPLETED"
+
+# Table header repeated under every reused test case in the efficiency section
+_MD_SUITE_USAGE_HEADER = "\n**Used in Test Suites:**\n\n| Test Suite | Type | Path |\n|------------|------|------|"
+
+# SQLite rejects compound SELECTs with more than 500 terms by default
+MAX_COMPOUND_SELECT_TERMS = 500
+
+# Pattern to match name=(value) or tag=(value1,value2) in Dynamic Test Suite filtering text
+_FILTERING_CRITERIA_RE = re.compile(r'(\w+)=\(([^)]*)\)')
+
+# Case folding of SQLite's NOCASE collation (ASCII letters only), used to compare tag names
+_NOCASE_FOLD = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_filtering_criteria_cached(filtering_text):
+    """Parse filtering text once per distinct value into a hashable criteria structure.
+    
+    Returns:
+        Tuple of (key, values) pairs, e.g. (('name', ('AC-',)), ('tag', ('api',)))
+    """
+    criteria = {}
+    
+    for key, value in _FILTERING_CRITERIA_RE.findall(filtering_text):
+        values = tuple(v for v in (part.strip() for part in value.split(',')) if v)
+        if values:
+            criteria[key] = values
+    
+    return tuple(criteria.items())
+
+
+@functools.lru_cache(maxsize=None)
+def _split_module(relative_path, depth):
+    """Split a test case path into its module name and module path in a single pass.
+    
+    Args:
+        relative_path: Test case path like 'Test Cases/Platform/Admin/API/test.tc'
+        depth: Number of directory levels deep from 'Test Cases/'
+        
+    Returns:
+        Tuple of (module_name, module_path), e.g. ('Admin', 'Test Cases/Platform/Admin') for depth=2;
+        ('Other', 'Other') when the path has no directory under 'Test Cases/'
+    """
+    if not relative_path or not relative_path.startswith('Test Cases/'):
+        return 'Other', 'Other'
+    
+    # Split path
+    path_parts = relative_path.split('/')
+    if len(path_parts) < 2:
+        return 'Other', 'Other'
+    
+    # Remove the .tc file from consideration (last element if it ends with .tc)
+    directory_parts = path_parts[:-1] if path_parts[-1].endswith('.tc') else path_parts
+    
+    # Calculate available directory depth (excluding 'Test Cases' at index 0)
+    available_depth = len(directory_parts) - 1
+    
+    if available_depth <= 0:
+        return 'Other', 'Other'
+    
+    # Use the minimum of configured depth and available depth
+    effective_depth = min(depth, available_depth)
+    
+    # Module name sits at effective depth (index 0 is 'Test Cases'); module path keeps the 'Test Cases' prefix
+    return directory_parts[effective_depth], '/'.join(directory_parts[:effective_depth + 1])
+
+
+def _format_filter_criteria(filtering_text):
+    """Format Dynamic Test Suite filtering text for a markdown table cell ('N/A' when empty)."""
+    if not filtering_text:
+        return 'N/A'
+    # Escape pipe characters in filter criteria for markdown table
+    return filtering_text.replace('|', '\\|')
+
 
 class AutomationProgressReporter:
     """Generate comprehensive automation progress reports for Lead Quality Engineers."""
@@ -59,41 +172,107 @@ class AutomationProgressReporter:
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {db_path}")
         
-        self.conn = sqlite3.connect(db_path)
+        # Keep more prepared statements warm: the report issues many distinct queries per run
+        self.conn = sqlite3.connect(db_path, isolation_level=None, cached_statements=256)
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
         self.output_format = output_format
         self.module_depth = module_depth
-        self.report_content = []  # Store report content for markdown output
+        self.report_buffer = io.StringIO()  # Buffer report content for markdown output
+        self._console_lines = []  # Pending console output, written once per report section
+        self._explicit_ids = None  # Test case IDs explicitly linked from test suites (computed once per run)
+        self._filtering_ids_cache = None  # Test case IDs matched by Dynamic Test Suites (computed once per run)
+        self._covered_ids_cache = None  # Test case IDs covered by any Test Suite or Dynamic Test Suite
+        self._suite_type_stats = None  # Per suite type counts and filter lengths (computed once per run)
+        self._total_test_cases = None  # Total number of test cases (counted once per run)
+        self._suite_counts = None  # (all suites, Dynamic Test Suites) counts (counted once per run)
+        self._tag_index = None  # Tag name -> test case IDs carrying it (built once per run)
+        self._name_prefix_ids = {}  # Name prefix pattern -> test case IDs whose name matches it
+        self._matching_ids_cache = {}  # Filtering criteria -> matching test case IDs
+        self._dynamic_suite_matches = None  # Dynamic Test Suite ID -> matching test case IDs (resolved once per run)
+        self._run_timestamp = datetime.now()  # Shared by the report header and every file this run writes
+        self._ensure_report_indexes()
+        self._apply_report_pragmas()
+    
+    def _ensure_report_indexes(self):
+        """Create the indexes used by report queries unless this database already has them."""
+        cursor = self.conn.cursor()
+        
+        if cursor.execute("PRAGMA user_version").fetchone()[0] >= REPORT_INDEX_VERSION:
+            return
+        
+        # The connection runs in autocommit mode, so wrap the setup in one explicit
+        # transaction - all indexes, their planner statistics and the version stamp are committed together
+        script = ";\n".join(
+            ["BEGIN", *REPORT_INDEXES, "ANALYZE", f"PRAGMA user_version = {REPORT_INDEX_VERSION}", "COMMIT"]
+        )
+        try:
+            self.conn.executescript(script)
+        except sqlite3.OperationalError:
+            # Read-only database - reports still work, just without the extra indexes
+            self.conn.rollback()
+    
+    def _apply_report_pragmas(self):
+        """Tune the connection for read-only reporting."""
+        for pragma in REPORT_PRAGMAS:
+            self.conn.execute(pragma)
+    
+    def close(self):
+        """Refresh planner statistics and close database connection."""
+        if self.conn:
+            self.conn.execute("PRAGMA query_only=OFF")
+            try:
+                # Let SQLite refresh planner statistics for the indexes used during this run
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.OperationalError:
+                pass  # Read-only database
+            self.conn.close()
     
     def _output(self, text, level=0):
-        """Output text to console or store for markdown."""
+        """Output text to console or buffer it for markdown."""
         if self.output_format == 'console':
-            print(text)
+            self._console_lines.append(text)
         else:
-            self.report_content.append(text)
+            self.report_buffer.write(text)
+            self.report_buffer.write('\n')
+    
+    def _output_lines(self, lines):
+        """Output a batch of lines (e.g. table rows) with a single buffer write."""
+        if self.output_format == 'console':
+            self._console_lines.extend(lines)
+        else:
+            self.report_buffer.writelines(f"{line}\n" for line in lines)
+    
+    def _flush_output(self):
+        """Write pending console lines to stdout in a single call."""
+        if self._console_lines:
+            sys.stdout.write("\n".join(self._console_lines) + "\n")
+            self._console_lines.clear()
     
     def _save_markdown_report(self, custom_filename=None, archive_folder=None):
-        """Save accumulated report content to markdown file."""
+        """Save buffered report content to markdown file."""
         if self.output_format == 'markdown':
             # Create archive folder if specified
             if archive_folder:
                 archive_path = Path(archive_folder)
                 archive_path.mkdir(exist_ok=True)
-                if custom_filename:
-                    # For archived files, add timestamp
-                    timestamp = datetime.now().strftime('%Y%m%d')
-                    base_name = Path(custom_filename).stem
-                    archived_file = archive_path / f"{base_name}_{timestamp}.md"
-                    
-                    with open(archived_file, 'w', encoding='utf-8') as f:
-                        f.write('\n'.join(self.report_content))
-                    print(f"📄 Archived report saved to: {archived_file}")
             
             # Save primary report file only if custom filename is provided
             if custom_filename:
                 markdown_file = Path(custom_filename)
                 with open(markdown_file, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(self.report_content))
+                    # Stream the buffer in chunks rather than materializing one large string
+                    self.report_buffer.seek(0)
+                    shutil.copyfileobj(self.report_buffer, f)
+                
+                if archive_folder:
+                    # For archived files, add timestamp and copy the primary file as-is
+                    timestamp = self._run_timestamp.strftime('%Y%m%d')
+                    base_name = Path(custom_filename).stem
+                    archived_file = archive_path / f"{base_name}_{timestamp}.md"
+                    
+                    shutil.copyfile(markdown_file, archived_file)
+                    print(f"📄 Archived report saved to: {archived_file}")
+                
                 print(f"📄 Markdown report saved to: {markdown_file}")
                 return markdown_file
             else:
@@ -115,28 +294,7 @@ class AutomationProgressReporter:
             depth=3: 'Test Cases/Website/test.tc' -> 'Website' (uses available depth)
             depth=4: 'Test Cases/Platform/Admin/test.tc' -> 'Admin' (uses available depth)
         """
-        if not relative_path or not relative_path.startswith('Test Cases/'):
-            return 'Other'
-        
-        # Split path and remove 'Test Cases' prefix
-        path_parts = relative_path.split('/')
-        if len(path_parts) < 2:
-            return 'Other'
-        
-        # Remove the .tc file from consideration (last element if it ends with .tc)
-        directory_parts = path_parts[:-1] if path_parts[-1].endswith('.tc') else path_parts
-        
-        # Calculate available directory depth (excluding 'Test Cases' at index 0)
-        available_depth = len(directory_parts) - 1
-        
-        if available_depth <= 0:
-            return 'Other'
-        
-        # Use the minimum of configured depth and available depth
-        effective_depth = min(self.module_depth, available_depth)
-        
-        # Extract module at effective depth (index 0 is 'Test Cases', so we use effective_depth as index)
-        return directory_parts[effective_depth]
+        return _split_module(relative_path, self.module_depth)[0]
     
     def _extract_module_path_from_path(self, relative_path):
         """Extract full directory path from relative path based on configured depth.
@@ -152,51 +310,36 @@ class AutomationProgressReporter:
             depth=3: 'Test Cases/Website/test.tc' -> 'Test Cases/Website' (uses available depth)
             depth=4: 'Test Cases/Platform/Admin/test.tc' -> 'Test Cases/Platform/Admin' (uses available depth)
         """
-        if not relative_path or not relative_path.startswith('Test Cases/'):
-            return 'Other'
-        
-        # Split path
-        path_parts = relative_path.split('/')
-        if len(path_parts) < 2:
-            return 'Other'
-        
-        # Remove the .tc file from consideration (last element if it ends with .tc)
-        directory_parts = path_parts[:-1] if path_parts[-1].endswith('.tc') else path_parts
-        
-        # Calculate available directory depth (excluding 'Test Cases' at index 0)
-        available_depth = len(directory_parts) - 1
-        
-        if available_depth <= 0:
-            return 'Other'
-        
-        # Use the minimum of configured depth and available depth
-        effective_depth = min(self.module_depth, available_depth)
-        
-        # Return the full path up to effective depth (including 'Test Cases')
-        return '/'.join(directory_parts[:effective_depth + 1])
+        return _split_module(relative_path, self.module_depth)[1]
     
     def _get_coverage_by_module_dynamic(self):
         """Get coverage statistics by module using consistent approach with overall coverage calculation."""
         cursor = self.conn.cursor()
+        cursor.row_factory = None  # Plain tuples - skip sqlite3.Row allocation for every path
         
-        # Get all test cases with their paths and coverage info using the same logic as overall coverage
+        # Aggregate test case counts and coverage per folder in SQL using the same logic as overall coverage
+        # - if test case is in test_suite_case_links, it's covered
+        # - '<folder>/.tc' stands in for every '<folder>/<name>.tc' path, since the module split
+        #   only looks at the folder; Python then splits one path per folder instead of per test case
         cursor.execute("""
             SELECT 
-                tc.relative_path,
-                tc.id,
-                CASE WHEN tscl.test_case_db_id IS NOT NULL THEN 1 ELSE 0 END as is_covered
+                CASE WHEN substr(tc.relative_path, -3) = '.tc'
+                     THEN rtrim(tc.relative_path, replace(tc.relative_path, '/', '')) || '.tc'
+                     ELSE tc.relative_path
+                END as folder_path,
+                COUNT(*) as total_cases,
+                SUM(CASE WHEN tscl.test_case_db_id IS NOT NULL THEN 1 ELSE 0 END) as total_covered
             FROM test_cases tc
             LEFT JOIN test_suite_case_links tscl ON tc.id = tscl.test_case_db_id
+            GROUP BY folder_path
         """)
         
-        test_cases = cursor.fetchall()
-        
-        # Group by module path
+        # Roll folder totals up by module path
         module_stats = {}
         
-        for test_case in test_cases:
+        for folder_path, total_cases, total_covered in cursor:
             # Extract the directory path up to the configured depth
-            module_path = self._extract_module_path_from_path(test_case['relative_path'])
+            _, module_path = _split_module(folder_path, self.module_depth)
             
             if module_path not in module_stats:
                 module_stats[module_path] = {
@@ -204,324 +347,254 @@ class AutomationProgressReporter:
                     'total_covered': 0
                 }
             
-            module_stats[module_path]['total_cases'] += 1
-            
-            # Use the same coverage logic as overall calculation - if test case is in test_suite_case_links, it's covered
-            if test_case['is_covered']:
-                module_stats[module_path]['total_covered'] += 1
+            module_stats[module_path]['total_cases'] += total_cases
+            module_stats[module_path]['total_covered'] += total_covered
         
         return module_stats
     
-    def _count_filtering_covered_cases_for_module(self, test_case_ids):
-        """Count test cases covered by filtering criteria for specific module."""
-        if not test_case_ids:
-            return 0
-        
-        cursor = self.conn.cursor()
-        
-        # Get all filtering test suites
-        cursor.execute("SELECT filtering_text FROM test_suites WHERE suite_type = 'FilteringTestSuiteEntity' AND filtering_text IS NOT NULL")
-        filtering_suites = cursor.fetchall()
-        
-        covered_ids = set()
-        
-        for suite in filtering_suites:
-            criteria = self._parse_filtering_criteria(suite['filtering_text'])
-            if criteria:
-                matching_ids = self._get_matching_test_case_ids(criteria)
-                # Only count test cases that belong to this module
-                module_matching_ids = [tc_id for tc_id in matching_ids if tc_id in test_case_ids]
-                covered_ids.update(module_matching_ids)
-        
-        return len(covered_ids)
-    
     def _get_explicitly_covered_case_ids_for_module(self, test_case_ids):
         """Get explicitly covered test case IDs for specific module."""
         if not test_case_ids:
             return []
         
-        cursor = self.conn.cursor()
-        placeholders = ','.join('?' * len(test_case_ids))
-        cursor.execute(f"""
-            SELECT DISTINCT tscl.test_case_db_id
-            FROM test_suite_case_links tscl
-            WHERE tscl.test_case_db_id IN ({placeholders})
-        """, test_case_ids)
-        
-        return [row['test_case_db_id'] for row in cursor.fetchall()]
+        return list(self._explicit_covered_ids().intersection(test_case_ids))
     
     def _get_filtering_covered_case_ids_for_module(self, test_case_ids):
-        """Get filtering covered test case IDs for specific module."""
-        if not test_case_ids:
-            return []
+        """Get filtering covered test case IDs for specific module.
         
-        cursor = self.conn.cursor()
-        
-        # Get all filtering test suites
-        cursor.execute("SELECT filtering_text FROM test_suites WHERE suite_type = 'FilteringTestSuiteEntity' AND filtering_text IS NOT NULL")
-        filtering_suites = cursor.fetchall()
-        
-        covered_ids = set()
-        
-        for suite in filtering_suites:
-            criteria = self._parse_filtering_criteria(suite['filtering_text'])
-            if criteria:
-                matching_ids = self._get_matching_test_case_ids(criteria)
-                # Only include test cases that belong to this module
-                module_matching_ids = [tc_id for tc_id in matching_ids if tc_id in test_case_ids]
-                covered_ids.update(module_matching_ids)
+        Returns:
+            Set of test case IDs; use len() on it for the module's filtering coverage count
+        """
+        if not test_case_ids:
+            return set()
         
-        return list(covered_ids)
+        # Only include test cases that belong to this module
+        return self._get_filtering_covered_case_ids().intersection(test_case_ids)
     
     def _parse_filtering_criteria(self, filtering_text):
         """Parse filtering text from Dynamic Test Suite to extract criteria."""
         if not filtering_text:
             return {}
         
-        criteria = {}
-        
-        # Pattern to match name=(value) or tag=(value1,value2)
-        pattern = r'(\w+)=\(([^)]*)\)'
-        matches = re.findall(pattern, filtering_text)
-        
-        for key, value in matches:
-            values = [v.strip() for v in value.split(',') if v.strip()]
-            if values:
-                criteria[key] = values
-        
-        return criteria
+        return {key: list(values) for key, values in _parse_filtering_criteria_cached(filtering_text)}
     
-    def _count_matching_test_cases(self, filtering_criteria):
-        """Count how many test cases match the filtering criteria."""
-        if not filtering_criteria:
-            return 0
+    def _get_matching_test_case_ids(self, filtering_criteria):
+        """Get test case IDs that match the filtering criteria.
         
-        cursor = self.conn.cursor()
+        Criteria are resolved with set operations over the cached tag index and name prefix
+        lookups, so evaluating many Dynamic Test Suites does not re-query test_cases per suite.
+        """
+        if not filtering_criteria:
+            return []
         
-        # Build WHERE clause based on criteria
-        where_conditions = []
-        params = []
-        
-        # Handle name criteria (usually prefix matching)
-        if 'name' in filtering_criteria:
-            name_conditions = []
-            for name_pattern in filtering_criteria['name']:
-                if name_pattern:
-                    name_conditions.append("name LIKE ?")
-                    params.append(f"{name_pattern}%")
+        # Several sections resolve the same Dynamic Test Suites, so reuse earlier results
+        cache_key = tuple(sorted((key, tuple(values)) for key, values in filtering_criteria.items()))
+        if cache_key in self._matching_ids_cache:
+            return list(self._matching_ids_cache[cache_key])
+        
+        matching_ids = None
+        
+        # Handle name criteria (prefix matching, any pattern may match)
+        name_patterns = [pattern for pattern in filtering_criteria.get('name', []) if pattern]
+        if name_patterns:
+            matching_ids = set().union(*(self._get_name_prefix_ids(pattern) for pattern in name_patterns))
+        
+        # Handle tag criteria (must contain all specified tags, compared case-insensitively)
+        tags = [tag.translate(_NOCASE_FOLD) for tag in filtering_criteria.get('tag', []) if tag]
+        if tags:
+            tag_index = self._get_tag_index()
+            tag_ids = set(tag_index.get(tags[0], ()))
+            for tag in tags[1:]:
+                tag_ids &= tag_index.get(tag, set())
+            matching_ids = tag_ids if matching_ids is None else matching_ids & tag_ids
+        
+        self._matching_ids_cache[cache_key] = frozenset(matching_ids or ())
+        return list(self._matching_ids_cache[cache_key])
+    
+    def _get_dynamic_suite_matches(self):
+        """Get matching test case IDs for every Dynamic Test Suite, keyed by suite ID (resolved once per run)."""
+        if self._dynamic_suite_matches is None:
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            cursor.execute("""
+                SELECT id, filtering_text 
+                FROM test_suites 
+                WHERE suite_type = 'FilteringTestSuiteEntity' 
+                AND filtering_text IS NOT NULL AND filtering_text != ''
+            """)
+            suite_criteria = [
+                (suite_id, self._parse_filtering_criteria(filtering_text))
+                for suite_id, filtering_text in cursor
+            ]
             
-            if name_conditions:
-                where_conditions.append(f"({' OR '.join(name_conditions)})")
-        
-        # Handle tag criteria (must contain all specified tags)
-        if 'tag' in filtering_criteria:
-            tag_conditions = []
-            for tag in filtering_criteria['tag']:
-                if tag:
-                    tag_conditions.append("(tags LIKE ? OR tags LIKE ? OR tags LIKE ? OR tags = ?)")
-                    # Handle tag at beginning, middle, end, or as only tag
-                    params.extend([f"{tag},%", f"%,{tag},%", f"%,{tag}", tag])
+            # Resolve the name prefixes of all suites up front with batched queries
+            self._prefetch_name_prefix_ids(
+                pattern for _, criteria in suite_criteria for pattern in criteria.get('name', [])
+            )
             
-            if tag_conditions:
-                where_conditions.append(f"({' AND '.join(tag_conditions)})")
+            self._dynamic_suite_matches = {}
+            for suite_id, criteria in suite_criteria:
+                matching_ids = self._get_matching_test_case_ids(criteria) if criteria else ()
+                self._dynamic_suite_matches[suite_id] = frozenset(matching_ids)
         
-        if not where_conditions:
-            return 0
-        
-        # Execute query
-        query = f"SELECT COUNT(*) FROM test_cases WHERE {' AND '.join(where_conditions)}"
-        cursor.execute(query, params)
-        return cursor.fetchone()[0]
+        return self._dynamic_suite_matches
     
-    def _count_filtering_covered_cases(self):
-        """Count unique test cases covered by Dynamic Test Suite suites."""
-        cursor = self.conn.cursor()
+    def _prefetch_name_prefix_ids(self, name_patterns):
+        """Resolve many name prefix patterns with UNION ALL queries instead of one query per pattern.
         
-        # Get all Dynamic Test Suite test suites with filtering criteria
-        cursor.execute("""
-            SELECT filtering_text 
-            FROM test_suites 
-            WHERE suite_type = 'FilteringTestSuiteEntity' 
-            AND filtering_text IS NOT NULL AND filtering_text != ''
-        """)
-        
-        filtering_suites = cursor.fetchall()
-        covered_test_case_ids = set()
-        
-        for suite in filtering_suites:
-            criteria = self._parse_filtering_criteria(suite['filtering_text'])
-            if criteria:
-                # Get test case IDs that match this filtering criteria
-                test_case_ids = self._get_matching_test_case_ids(criteria)
-                covered_test_case_ids.update(test_case_ids)
+        Args:
+            name_patterns: Iterable of name prefix patterns; already cached patterns are skipped
+        """
+        missing = [pattern for pattern in dict.fromkeys(name_patterns) if pattern and pattern not in self._name_prefix_ids]
         
-        return len(covered_test_case_ids)
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        for start in range(0, len(missing), MAX_COMPOUND_SELECT_TERMS):
+            chunk = missing[start:start + MAX_COMPOUND_SELECT_TERMS]
+            # Each branch keeps a constant prefix LIKE, so it can still use the name index
+            sql = " UNION ALL ".join(["SELECT ?, id FROM test_cases WHERE name LIKE ?"] * len(chunk))
+            params = [value for pattern in chunk for value in (pattern, f"{pattern}%")]
+            
+            for pattern in chunk:
+                self._name_prefix_ids[pattern] = set()
+            for pattern, test_case_id in cursor.execute(sql, params):
+                self._name_prefix_ids[pattern].add(test_case_id)
     
-    def _get_matching_test_case_ids(self, filtering_criteria):
-        """Get test case IDs that match the filtering criteria."""
-        if not filtering_criteria:
-            return []
+    def _get_tag_index(self):
+        """Get a mapping of NOCASE-folded tag name to the IDs of test cases carrying it (cached per report run)."""
+        if self._tag_index is None:
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            cursor.execute("""
+                SELECT t.tag_name, tct.test_case_id
+                FROM test_case_tags tct
+                JOIN tags t ON t.id = tct.tag_id
+                JOIN test_cases tc ON tc.id = tct.test_case_id
+            """)
+            self._tag_index = {}
+            for tag_name, test_case_id in cursor:
+                self._tag_index.setdefault(tag_name.translate(_NOCASE_FOLD), set()).add(test_case_id)
         
-        cursor = self.conn.cursor()
+        return self._tag_index
+    
+    def _get_name_prefix_ids(self, name_pattern):
+        """Get IDs of test cases whose name starts with the pattern (cached per pattern)."""
+        if name_pattern not in self._name_prefix_ids:
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            cursor.execute("SELECT id FROM test_cases WHERE name LIKE ?", (f"{name_pattern}%",))
+            self._name_prefix_ids[name_pattern] = {row[0] for row in cursor}
+        
+        return self._name_prefix_ids[name_pattern]
+    
+    def _get_filtering_covered_case_ids(self):
+        """Get unique test case IDs covered by Dynamic Test Suites.
         
-        # Build WHERE clause based on criteria
-        where_conditions = []
-        params = []
-        
-        # Handle name criteria (usually prefix matching)
-        if 'name' in filtering_criteria:
-            name_conditions = []
-            for name_pattern in filtering_criteria['name']:
-                if name_pattern:
-                    name_conditions.append("name LIKE ?")
-                    params.append(f"{name_pattern}%")
-            
-            if name_conditions:
-                where_conditions.append(f"({' OR '.join(name_conditions)})")
-        
-        # Handle tag criteria (must contain all specified tags)
-        if 'tag' in filtering_criteria:
-            tag_conditions = []
-            for tag in filtering_criteria['tag']:
-                if tag:
-                    tag_conditions.append("(tags LIKE ? OR tags LIKE ? OR tags LIKE ? OR tags = ?)")
-                    # Handle tag at beginning, middle, end, or as only tag
-                    params.extend([f"{tag},%", f"%,{tag},%", f"%,{tag}", tag])
-            
-            if tag_conditions:
-                where_conditions.append(f"({' AND '.join(tag_conditions)})")
+        The result is the union of the per-suite matches and is cached for the lifetime
+        of the reporter, so every report section shares one evaluation of the filtering criteria.
+        """
+        if self._filtering_ids_cache is None:
+            self._filtering_ids_cache = frozenset().union(*self._get_dynamic_suite_matches().values())
         
-        if not where_conditions:
-            return []
+        return self._filtering_ids_cache
+    
+    def _explicit_covered_ids(self):
+        """Get test case IDs explicitly linked from any test suite (cached per report run)."""
+        if self._explicit_ids is None:
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            cursor.execute("""
+                SELECT DISTINCT tscl.test_case_db_id
+                FROM test_suite_case_links tscl 
+                WHERE tscl.test_case_db_id IS NOT NULL
+            """)
+            self._explicit_ids = frozenset(row[0] for row in cursor)
         
-        # Execute query to get IDs
-        query = f"SELECT id FROM test_cases WHERE {' AND '.join(where_conditions)}"
-        cursor.execute(query, params)
-        return [row[0] for row in cursor.fetchall()]
+        return self._explicit_ids
     
-    def _build_filtering_union_query(self):
-        """Build a UNION query for all Dynamic Test Suite criteria."""
-        cursor = self.conn.cursor()
+    def _get_total_test_cases(self):
+        """Get the total number of test cases (cached per report run)."""
+        if self._total_test_cases is None:
+            self._total_test_cases = self.conn.execute("SELECT COUNT(*) FROM test_cases").fetchone()[0]
         
-        # Get all Dynamic Test Suite test suites with filtering criteria
-        cursor.execute("""
-            SELECT filtering_text 
-            FROM test_suites 
-            WHERE suite_type = 'FilteringTestSuiteEntity' 
-            AND filtering_text IS NOT NULL AND filtering_text != ''
-        """)
+        return self._total_test_cases
+    
+    def _get_suite_counts(self):
+        """Get the total and Dynamic Test Suite counts of test suites (cached per report run).
         
-        filtering_suites = cursor.fetchall()
-        union_conditions = []
+        Returns:
+            Tuple of (total_suites, filtering_suites)
+        """
+        if self._suite_counts is None:
+            self._suite_counts = tuple(self.conn.execute("""
+                SELECT 
+                    COUNT(*),
+                    COUNT(CASE WHEN suite_type = 'FilteringTestSuiteEntity' THEN 1 END)
+                FROM test_suites
+            """).fetchone())
+        
+        return self._suite_counts
+    
+    def _get_suite_type_stats(self):
+        """Get suite count and average filter length per suite type (cached per report run)."""
+        if self._suite_type_stats is None:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT 
+                    suite_type_alias,
+                    COUNT(*) as count,
+                    AVG(LENGTH(filtering_text)) as avg_filter_complexity
+                FROM test_suites 
+                WHERE suite_type_alias IS NOT NULL
+                GROUP BY suite_type_alias
+            """)
+            self._suite_type_stats = cursor.fetchall()
         
-        for suite in filtering_suites:
-            criteria = self._parse_filtering_criteria(suite['filtering_text'])
-            if criteria:
-                where_conditions = []
-                
-                # Handle name criteria
-                if 'name' in criteria:
-                    name_conditions = []
-                    for name_pattern in criteria['name']:
-                        if name_pattern:
-                            name_conditions.append(f"name LIKE '{name_pattern}%'")
-                    
-                    if name_conditions:
-                        where_conditions.append(f"({' OR '.join(name_conditions)})")
-                
-                # Handle tag criteria
-                if 'tag' in criteria:
-                    tag_conditions = []
-                    for tag in criteria['tag']:
-                        if tag:
-                            tag_conditions.append(f"(tags LIKE '{tag},%' OR tags LIKE '%,{tag},%' OR tags LIKE '%,{tag}' OR tags = '{tag}')")
-                    
-                    if tag_conditions:
-                        where_conditions.append(f"({' AND '.join(tag_conditions)})")
-                
-                if where_conditions:
-                    union_conditions.append(' AND '.join(where_conditions))
+        return self._suite_type_stats
+    
+    def _get_covered_case_ids(self):
+        """Get IDs of test cases covered by Test Suites or Dynamic Test Suites (cached per report run)."""
+        if self._covered_ids_cache is None:
+            self._covered_ids_cache = self._explicit_covered_ids() | self._get_filtering_covered_case_ids()
         
-        if union_conditions:
-            return ' OR '.join([f"({condition})" for condition in union_conditions])
-        else:
-            return "1=0"  # No matches if no valid conditions
+        return self._covered_ids_cache
     
     def _get_total_unique_covered_cases(self):
         """Get total unique test cases covered by both Test Suite and Dynamic Test Suite."""
-        cursor = self.conn.cursor()
-        
-        # Get explicitly linked test case IDs (Test Suite)
-        cursor.execute("""
-            SELECT DISTINCT tscl.test_case_db_id as test_case_id
-            FROM test_suite_case_links tscl 
-            WHERE tscl.test_case_db_id IS NOT NULL
-        """)
-        explicit_ids = {row['test_case_id'] for row in cursor.fetchall()}
-        
-        # Get dynamically covered test case IDs (Dynamic Test Suite)
-        cursor.execute("""
-            SELECT filtering_text 
-            FROM test_suites 
-            WHERE suite_type = 'FilteringTestSuiteEntity' 
-            AND filtering_text IS NOT NULL AND filtering_text != ''
-        """)
-        
-        filtering_suites = cursor.fetchall()
-        filtering_ids = set()
-        
-        for suite in filtering_suites:
-            criteria = self._parse_filtering_criteria(suite['filtering_text'])
-            if criteria:
-                test_case_ids = self._get_matching_test_case_ids(criteria)
-                filtering_ids.update(test_case_ids)
-        
-        # Combine both sets to get unique coverage
-        total_unique_ids = explicit_ids.union(filtering_ids)
-        return len(total_unique_ids)
+        return len(self._get_covered_case_ids())
         
     def generate_executive_summary(self):
         """Generate high-level executive summary for leadership."""
         if self.output_format == 'markdown':
-            self._output("# 📊 Test Automation Project Statistics Report")
+            self._output(_MD_REPORT_TITLE)
             self._output("")
-            self._output(f"- **📊 Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            self._output(f"- **📊 Report Generated:** {self._run_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
             self._output(f"- **📁 Database:** {self.db_path.name}")
             self._output(f"- **🏗️ Project based:** Katalon Studio")
             self._output("")
         else:
-            self._output("=" * 80)
-            self._output("📊 TEST AUTOMATION PROJECT STATISTICS REPORT")
-            self._output("=" * 80)
-            self._output(f"📊 Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            self._output(_CONSOLE_RULE)
+            self._output(_CONSOLE_REPORT_TITLE)
+            self._output(_CONSOLE_RULE)
+            self._output(f"📊 Report Generated: {self._run_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
             self._output(f"📁 Database: {self.db_path.name}")
             self._output(f"🏗️ Project based: Katalon Studio")
             self._output("")
         
-        # Overall metrics
+        # Overall metrics - test case, suite and link counts in one statement; the counts
+        # later sections need are kept so they do not scan the tables again
         cursor = self.conn.cursor()
-        
-        # Test case metrics
-        cursor.execute("SELECT COUNT(*) as total FROM test_cases")
-        total_test_cases = cursor.fetchone()['total']
-        
-        cursor.execute("SELECT COUNT(*) as total FROM test_suites")
-        total_test_suites = cursor.fetchone()['total']
-        
-        cursor.execute("SELECT COUNT(*) as total FROM test_suite_case_links")
-        total_links = cursor.fetchone()['total']
-        
-        # Coverage metrics - count both explicit links and filtering matches
-        # Get explicitly linked test cases (Test Suite)
+        cursor.row_factory = None
         cursor.execute("""
-            SELECT COUNT(DISTINCT tc.id) as explicit_covered_cases
-            FROM test_cases tc
-            JOIN test_suite_case_links tscl ON tc.id = tscl.test_case_db_id
+            SELECT 
+                (SELECT COUNT(*) FROM test_cases) AS total_test_cases,
+                (SELECT COUNT(*) FROM test_suites) AS total_test_suites,
+                (SELECT COUNT(*) FROM test_suites WHERE suite_type = 'FilteringTestSuiteEntity') AS filtering_suites,
+                (SELECT COUNT(*) FROM test_suite_case_links) AS total_links
         """)
-        explicit_covered_cases = cursor.fetchone()['explicit_covered_cases']
-        
-        # Get dynamically covered test cases (Dynamic Test Suite)
-        filtering_covered_cases = self._count_filtering_covered_cases()
+        total_test_cases, total_test_suites, filtering_suites, total_links = cursor.fetchone()
+        self._total_test_cases = total_test_cases
+        self._suite_counts = (total_test_suites, filtering_suites)
         
         # Calculate total unique covered cases (combine both types)
         covered_cases = self._get_total_unique_covered_cases()
@@ -618,16 +691,7 @@ class AutomationProgressReporter:
             self._output(f"  • Avg Description Length: {complexity['avg_description_length']:.0f} chars")
         
         # Test suite sophistication
-        cursor.execute("""
-            SELECT 
-                suite_type_alias,
-                COUNT(*) as count,
-                AVG(LENGTH(filtering_text)) as avg_filter_complexity
-            FROM test_suites 
-            WHERE suite_type_alias IS NOT NULL
-            GROUP BY suite_type_alias
-        """)
-        suite_types = cursor.fetchall()
+        suite_types = self._get_suite_type_stats()
         
         if self.output_format == 'markdown':
             self._output("### Test Suite Sophistication")
@@ -662,7 +726,8 @@ class AutomationProgressReporter:
             coverage_data.append({
                 'module': module,
                 'total_cases': stats['total_cases'],
-                'covered_cases': stats['total_covered']
+                'covered_cases': stats['total_covered'],
+                'coverage_pct': (stats['total_covered'] / stats['total_cases'] * 100) if stats['total_cases'] > 0 else 0
             })
         
         if self.output_format == 'markdown':
@@ -677,17 +742,19 @@ class AutomationProgressReporter:
             self._output("")
             self._output("| Module | Present in TS | Total | Coverage % |")
             self._output("|--------|---------|-------|------------|")
-            for row in coverage_data:
-                coverage_pct = (row['covered_cases'] / row['total_cases'] * 100) if row['total_cases'] > 0 else 0
-                self._output(f"| {row['module']} | {row['covered_cases']} | {row['total_cases']} | {coverage_pct:.1f}% |")
+            self._output_lines(
+                f"| {row['module']} | {row['covered_cases']} | {row['total_cases']} | {row['coverage_pct']:.1f}% |"
+                for row in coverage_data
+            )
             self._output("")
             self._output("</details>")
             self._output("")
         else:
             self._output("Coverage by Module:")
-            for row in coverage_data:
-                coverage_pct = (row['covered_cases'] / row['total_cases'] * 100) if row['total_cases'] > 0 else 0
-                self._output(f"  • {row['module']:<12}: {row['covered_cases']:>3}/{row['total_cases']:<3} ({coverage_pct:>5.1f}%)")
+            self._output_lines(
+                f"  • {row['module']:<12}: {row['covered_cases']:>3}/{row['total_cases']:<3} ({row['coverage_pct']:>5.1f}%)"
+                for row in coverage_data
+            )
             self._output("")
         
     def analyze_priority_and_risk(self):
@@ -702,36 +769,40 @@ class AutomationProgressReporter:
         cursor = self.conn.cursor()
         
         # Priority tag analysis using global PRIORITY_TAGS configuration
-        # Build dynamic CASE statement for priority classification
-        case_conditions = []
-        order_conditions = []
-        
-        for priority in PRIORITY_TAGS:
-            case_conditions.append(f"WHEN tags LIKE '%{priority['tag']}%' THEN '{priority['label']}'")
-            order_conditions.append(f"WHEN '{priority['label']}' THEN {priority['order']}")
-        
-        case_statement = "\n                    ".join(case_conditions)
-        order_statement = "\n                    ".join(order_conditions)
+        # Classify test cases by joining the normalized tags against the configured priority tags;
+        # when a test case has several priority tags, the first one in PRIORITY_TAGS wins
+        priority_values = ", ".join(["(?, ?, ?, ?)"] * len(PRIORITY_TAGS))
+        priority_params = [
+            value
+            for position, priority in enumerate(PRIORITY_TAGS)
+            for value in (position, priority['tag'], priority['label'], priority['order'])
+        ]
         
         priority_sql = f"""
+            WITH priority_tags(position, tag_name, label, sort_order) AS (
+                VALUES {priority_values}
+            ),
+            test_case_priority AS (
+                SELECT tct.test_case_id, MIN(pt.position) as position
+                FROM priority_tags pt
+                JOIN tags t ON t.tag_name = pt.tag_name COLLATE NOCASE
+                JOIN test_case_tags tct ON tct.tag_id = t.id
+                GROUP BY tct.test_case_id
+            )
             SELECT 
-                CASE 
-                    {case_statement}
-                    ELSE 'Unclassified'
-                END as priority,
+                COALESCE(pt.label, 'Unclassified') as priority,
                 COUNT(*) as count,
-                COUNT(DISTINCT tscl.test_case_db_id) as covered
+                COUNT(DISTINCT tscl.test_case_db_id) as covered,
+                CAST(COUNT(DISTINCT tscl.test_case_db_id) AS REAL) / COUNT(*) * 100 as coverage_pct
             FROM test_cases tc
+            LEFT JOIN test_case_priority tcp ON tcp.test_case_id = tc.id
+            LEFT JOIN priority_tags pt ON pt.position = tcp.position
             LEFT JOIN test_suite_case_links tscl ON tc.id = tscl.test_case_db_id
             GROUP BY priority
-            ORDER BY 
-                CASE priority
-                    {order_statement}
-                    ELSE 999
-                END
+            ORDER BY COALESCE(MIN(pt.sort_order), 999)
         """
         
-        cursor.execute(priority_sql)
+        cursor.execute(priority_sql, priority_params)
         
         priority_data = cursor.fetchall()
         
@@ -740,40 +811,51 @@ class AutomationProgressReporter:
             self._output("")
             # Generate dynamic note based on configured priority tags
             tag_list = ", ".join([f"`{priority['tag']}`" for priority in PRIORITY_TAGS])
-            for row in priority_data:
-                coverage_pct = (row['covered'] / row['count'] * 100) if row['count'] > 0 else 0
-                self._output(f"- **{row['priority']}:** {row['count']} tests ({coverage_pct:.1f}% in suites)")
+            self._output_lines(
+                f"- **{row['priority']}:** {row['count']} tests ({row['coverage_pct']:.1f}% in suites)"
+                for row in priority_data
+            )
             self._output("")
         else:
             self._output("Test Priority Distribution:")
-            for row in priority_data:
-                coverage_pct = (row['covered'] / row['count'] * 100) if row['count'] > 0 else 0
-                self._output(f"  • {row['priority']:<15}: {row['count']:>3} tests ({coverage_pct:>5.1f}% in suites)")
+            self._output_lines(
+                f"  • {row['priority']:<15}: {row['count']:>3} tests ({row['coverage_pct']:>5.1f}% in suites)"
+                for row in priority_data
+            )
         
         # Test type analysis using global TEST_TYPE_TAGS configuration
-        # Build dynamic CASE statement for test type classification
-        type_case_conditions = []
-        
-        for test_type in TEST_TYPE_TAGS:
-            type_case_conditions.append(f"WHEN tags LIKE '%{test_type['tag']}%' THEN '{test_type['label']}'")
-        
-        type_case_statement = "\n                    ".join(type_case_conditions)
+        # Classify test cases the same way; the first matching tag in TEST_TYPE_TAGS wins
+        type_values = ", ".join(["(?, ?, ?)"] * len(TEST_TYPE_TAGS))
+        type_params = [
+            value
+            for position, test_type in enumerate(TEST_TYPE_TAGS)
+            for value in (position, test_type['tag'], test_type['label'])
+        ]
         
         test_type_sql = f"""
+            WITH type_tags(position, tag_name, label) AS (
+                VALUES {type_values}
+            ),
+            test_case_type AS (
+                SELECT tct.test_case_id, MIN(tt.position) as position
+                FROM type_tags tt
+                JOIN tags t ON t.tag_name = tt.tag_name COLLATE NOCASE
+                JOIN test_case_tags tct ON tct.tag_id = t.id
+                GROUP BY tct.test_case_id
+            )
             SELECT 
-                CASE 
-                    {type_case_statement}
-                    ELSE 'Other'
-                END as test_type,
+                COALESCE(tt.label, 'Other') as test_type,
                 COUNT(*) as count
-            FROM test_cases
-            WHERE tags IS NOT NULL
+            FROM test_cases tc
+            LEFT JOIN test_case_type tct ON tct.test_case_id = tc.id
+            LEFT JOIN type_tags tt ON tt.position = tct.position
+            WHERE tc.tags IS NOT NULL
             GROUP BY test_type
             ORDER BY count DESC
             LIMIT 10
         """
         
-        cursor.execute(test_type_sql)
+        cursor.execute(test_type_sql, type_params)
         
         test_types = cursor.fetchall()
         
@@ -790,16 +872,19 @@ class AutomationProgressReporter:
             self._output("")
         
         # Test tag distribution analysis
-        cursor.execute(f"""
-            SELECT tag_name, COUNT(*) as usage_count
+        total_test_cases = self._get_total_test_cases()
+        
+        # Rows are streamed straight from the cursor into the table below, as plain tuples
+        tag_cursor = self.conn.cursor()
+        tag_cursor.row_factory = None
+        tag_distribution = tag_cursor.execute(f"""
+            SELECT tag_name, COUNT(*) as usage_count, CAST(COUNT(*) AS REAL) / ? * 100 as percentage
             FROM tags t
             JOIN test_case_tags tct ON t.id = tct.tag_id
             GROUP BY tag_name
-            ORDER BY usage_count DESC
+            ORDER BY usage_count DESC, tag_name
             LIMIT {TOP_TAGS_LIMIT}
-        """)
-        
-        tag_distribution = cursor.fetchall()
+        """, (total_test_cases,))
         
         if self.output_format == 'markdown':
             self._output("### Test Tag Distribution")
@@ -811,20 +896,19 @@ class AutomationProgressReporter:
             self._output("")
             self._output("| Tag | Usage Count | Percentage |")
             self._output("|-----|-------------|------------|")
-            
-            total_test_cases = cursor.execute("SELECT COUNT(*) FROM test_cases").fetchone()[0]
-            for row in tag_distribution:
-                percentage = (row['usage_count'] / total_test_cases * 100)
-                self._output(f"| **{row['tag_name']}** | {row['usage_count']} | {percentage:.1f}% |")
+            self._output_lines(
+                f"| **{tag_name}** | {usage_count} | {percentage:.1f}% |"
+                for tag_name, usage_count, percentage in tag_distribution
+            )
             self._output("")
             self._output("</details>")
             self._output("")
         else:
             self._output(f"\nTest Tag Distribution:")
-            total_test_cases = cursor.execute("SELECT COUNT(*) FROM test_cases").fetchone()[0]
-            for row in tag_distribution:
-                percentage = (row['usage_count'] / total_test_cases * 100)
-                self._output(f"  • {row['tag_name']:<15}: {row['usage_count']:>3} tests ({percentage:>5.1f}%)")
+            self._output_lines(
+                f"  • {tag_name:<15}: {usage_count:>3} tests ({percentage:>5.1f}%)"
+                for tag_name, usage_count, percentage in tag_distribution
+            )
             self._output("")
         
     def analyze_automation_efficiency(self):
@@ -838,8 +922,13 @@ class AutomationProgressReporter:
         
         cursor = self.conn.cursor()
         
+        # Plain tuple rows for the high-volume queries below; fields are unpacked by position
+        tuple_cursor = self.conn.cursor()
+        tuple_cursor.row_factory = None
+        
         # Test reusability analysis - get all test cases that appear in more than 1 test suite
-        cursor.execute("""
+        # (rows are streamed from the cursor; the markdown summary gets its total from a COUNT query)
+        reusable_tests_sql = """
             SELECT 
                 tc.id,
                 tc.name,
@@ -851,9 +940,7 @@ class AutomationProgressReporter:
             GROUP BY tc.id
             HAVING COUNT(tscl.id) > 1
             ORDER BY reuse_count DESC, tc.name
-        """)
-        
-        reusable_tests = cursor.fetchall()
+        """
         
         if self.output_format == 'markdown':
             self._output("### Most Reused Test Cases")
@@ -861,50 +948,62 @@ class AutomationProgressReporter:
             self._output("Test cases that appear in multiple test suites (including dynamic test suites) demonstrate good reusability or might need to review for optimization to avoid duplicated execution.")
             self._output("")
             
-            if reusable_tests:
-                self._output(f"**Total Reused Test Cases:** {len(reusable_tests)}")
+            cursor.execute("""
+                SELECT COUNT(*) FROM (
+                    SELECT tc.id
+                    FROM test_cases tc
+                    JOIN test_suite_case_links tscl ON tc.id = tscl.test_case_db_id
+                    GROUP BY tc.id
+                    HAVING COUNT(tscl.id) > 1
+                )
+            """)
+            reusable_count = cursor.fetchone()[0]
+            
+            if reusable_count:
+                self._output(f"**Total Reused Test Cases:** {reusable_count}")
                 self._output("")
                 
                 # Create higher-level collapsible wrapper around all detailed sections
                 self._output("<details>")
-                self._output(f"<summary><strong>📋 View All Reused Test Cases Details</strong> ({len(reusable_tests)} test cases)</summary>")
+                self._output(f"<summary><strong>📋 View All Reused Test Cases Details</strong> ({reusable_count} test cases)</summary>")
                 self._output("")
                 
-                for test in reusable_tests:
-                    # Get the specific test suites this test case appears in
-                    cursor.execute("""
-                        SELECT DISTINCT
-                            ts.name as suite_name,
-                            ts.suite_type_alias,
-                            ts.relative_path as suite_path
-                        FROM test_suite_case_links tscl
-                        JOIN test_suites ts ON tscl.test_suite_id = ts.id
-                        WHERE tscl.test_case_db_id = ?
-                        ORDER BY ts.name
-                    """, (test['id'],))
-                    
-                    suite_usage = cursor.fetchall()
-                    
-                    self._output(f"<details>")
-                    self._output(f"<summary><strong>🔄 {test['name']}</strong> (used in {test['reuse_count']} suites)</summary>")
-                    self._output("")
-                    self._output(f"**Test Case Path:** `{test['relative_path']}`")
-                    if test['tags']:
-                        self._output(f"**Tags:** `{test['tags']}`")
-                    self._output("")
-                    self._output("**Used in Test Suites:**")
-                    self._output("")
-                    self._output("| Test Suite | Type | Path |")
-                    self._output("|------------|------|------|")
+                # Get the test suites every reused test case appears in with one query,
+                # then group them per test case
+                cursor.execute("""
+                    SELECT DISTINCT
+                        tscl.test_case_db_id,
+                        ts.name as suite_name,
+                        ts.suite_type_alias,
+                        ts.relative_path as suite_path
+                    FROM test_suite_case_links tscl
+                    JOIN test_suites ts ON tscl.test_suite_id = ts.id
+                    WHERE tscl.test_case_db_id IN (
+                        SELECT test_case_db_id
+                        FROM test_suite_case_links
+                        GROUP BY test_case_db_id
+                        HAVING COUNT(*) > 1
+                    )
+                    ORDER BY tscl.test_case_db_id, ts.name
+                """)
+                
+                # Render each suite row once while grouping
+                suite_usage_by_test = {}
+                for test_case_db_id, suite_name, suite_type_alias, suite_path in cursor:
+                    suite_usage_by_test.setdefault(test_case_db_id, []).append(
+                        f"| `{suite_name}` | {suite_type_alias or 'Unknown'} | `{suite_path}` |"
+                    )
+                
+                for test_id, name, relative_path, tags, reuse_count in tuple_cursor.execute(reusable_tests_sql):
+                    self._output(f"<details>\n<summary><strong>🔄 {name}</strong> (used in {reuse_count} suites)</summary>\n\n**Test Case Path:** `{relative_path}`")
+                    if tags:
+                        self._output(f"**Tags:** `{tags}`")
+                    self._output(_MD_SUITE_USAGE_HEADER)
                     
-                    for suite in suite_usage:
-                        suite_type_friendly = suite['suite_type_alias'] or 'Unknown'
-                        
-                        self._output(f"| `{suite['suite_name']}` | {suite_type_friendly} | `{suite['suite_path']}` |")
+                    # The specific test suites this test case appears in
+                    self._output_lines(suite_usage_by_test.get(test_id, ()))
                     
-                    self._output("")
-                    self._output("</details>")
-                    self._output("")
+                    self._output("\n</details>\n")
                 
                 # Close the higher-level collapsible wrapper
                 self._output("</details>")
@@ -914,15 +1013,16 @@ class AutomationProgressReporter:
             self._output("")
         else:
             self._output("Most Reused Test Cases:")
-            if reusable_tests:
-                for i, test in enumerate(reusable_tests, 1):
-                    self._output(f"  {i:>2}. {test['name'][:50]:<50} ({test['reuse_count']} suites)")
-            else:
+            reused = 0
+            for reused, (_, name, _, _, reuse_count) in enumerate(tuple_cursor.execute(reusable_tests_sql), 1):
+                self._output(f"  {reused:>2}. {name[:50]:<50} ({reuse_count} suites)")
+            if not reused:
                 self._output("  No test cases are reused across multiple suites.")
         
         # Complete test suite inventory with correct test counts for filtering suites
-        cursor.execute("""
+        tuple_cursor.execute("""
             SELECT 
+                ts.id,
                 ts.name,
                 ts.suite_type,
                 ts.suite_type_alias,
@@ -935,27 +1035,24 @@ class AutomationProgressReporter:
             ORDER BY ts.name ASC
         """)
         
-        all_suites_raw = cursor.fetchall()
-        
-        # Calculate correct test counts for each suite
+        # Calculate correct test counts for each suite, streaming rows from the cursor
+        dynamic_suite_matches = self._get_dynamic_suite_matches()
         all_suites = []
-        for suite in all_suites_raw:
-            if suite['suite_type'] == 'FilteringTestSuiteEntity' and suite['filtering_text']:
+        for suite_id, name, suite_type, suite_type_alias, filtering_text, relative_path, explicit_test_count in tuple_cursor:
+            if suite_type == 'FilteringTestSuiteEntity' and filtering_text:
                 # For Dynamic Test Suites, count matching test cases based on filtering criteria
-                criteria = self._parse_filtering_criteria(suite['filtering_text'])
-                filtering_count = len(self._get_matching_test_case_ids(criteria)) if criteria else 0
-                test_count = filtering_count
+                test_count = len(dynamic_suite_matches.get(suite_id, ()))
             else:
                 # For regular Test Suites, use explicit test case links
-                test_count = suite['explicit_test_count']
+                test_count = explicit_test_count
             
             all_suites.append({
-                'name': suite['name'],
-                'suite_type': suite['suite_type'],
-                'suite_type_friendly': suite['suite_type_alias'] or 'Unknown',
+                'name': name,
+                'suite_type': suite_type,
+                'suite_type_friendly': suite_type_alias or 'Unknown',
                 'test_count': test_count,
-                'relative_path': suite['relative_path'],
-                'filtering_text': suite['filtering_text'] if suite['suite_type'] == 'FilteringTestSuiteEntity' else None
+                'relative_path': relative_path,
+                'filtering_text': filtering_text if suite_type == 'FilteringTestSuiteEntity' else None
             })
         
         if self.output_format == 'markdown':
@@ -964,9 +1061,16 @@ class AutomationProgressReporter:
             self._output("This comprehensive inventory provides detailed information about all test suites in the project, including their types, test case counts, and filtering criteria. Test suites are organized by their content status to help identify potential maintenance needs.")
             self._output("")
             
-            # Separate empty and non-empty test suites (exclude Test Suite Collections from both categories)
-            empty_suites = [suite for suite in all_suites if suite['test_count'] == 0 and suite['suite_type'] != 'TestSuiteCollectionEntity']
-            non_empty_suites = [suite for suite in all_suites if suite['test_count'] > 0 and suite['suite_type'] != 'TestSuiteCollectionEntity']
+            # Separate empty and non-empty test suites in one pass (exclude Test Suite Collections from both categories)
+            empty_suites = []
+            non_empty_suites = []
+            for suite in all_suites:
+                if suite['suite_type'] == 'TestSuiteCollectionEntity':
+                    continue
+                if suite['test_count'] == 0:
+                    empty_suites.append(suite)
+                elif suite['test_count'] > 0:
+                    non_empty_suites.append(suite)
             
             # Display empty test suites if any exist
             if empty_suites:
@@ -977,12 +1081,10 @@ class AutomationProgressReporter:
                 self._output("")
                 self._output("| Test Suite Name | Type | Path | Filter Criteria |")
                 self._output("|-----------------|------|------|------------------|")
-                for suite in empty_suites:
-                    path = suite['relative_path'] or 'N/A'
-                    filter_criteria = suite['filtering_text'] or 'N/A'
-                    # Escape pipe characters in filter criteria for markdown table
-                    filter_criteria = filter_criteria.replace('|', '\\|') if filter_criteria != 'N/A' else 'N/A'
-                    self._output(f"| **{suite['name']}** | {suite['suite_type_friendly']} | `{path}` | `{filter_criteria}` |")
+                self._output_lines(
+                    f"| **{suite['name']}** | {suite['suite_type_friendly']} | `{suite['relative_path'] or 'N/A'}` | `{_format_filter_criteria(suite['filtering_text'])}` |"
+                    for suite in empty_suites
+                )
                 self._output("")
                 self._output("</details>")
                 self._output("")
@@ -996,12 +1098,10 @@ class AutomationProgressReporter:
                 self._output("")
                 self._output("| Test Suite Name | Type | Test Cases | Path | Filter Criteria |")
                 self._output("|-----------------|------|------------|------|------------------|")
-                for suite in non_empty_suites:
-                    path = suite['relative_path'] or 'N/A'
-                    filter_criteria = suite['filtering_text'] or 'N/A'
-                    # Escape pipe characters in filter criteria for markdown table
-                    filter_criteria = filter_criteria.replace('|', '\\|') if filter_criteria != 'N/A' else 'N/A'
-                    self._output(f"| **{suite['name']}** | {suite['suite_type_friendly']} | {suite['test_count']} | `{path}` | `{filter_criteria}` |")
+                self._output_lines(
+                    f"| **{suite['name']}** | {suite['suite_type_friendly']} | {suite['test_count']} | `{suite['relative_path'] or 'N/A'}` | `{_format_filter_criteria(suite['filtering_text'])}` |"
+                    for suite in non_empty_suites
+                )
                 self._output("")
                 self._output("</details>")
                 self._output("")
@@ -1039,17 +1139,38 @@ class AutomationProgressReporter:
             self._output("Test Suite Collections are orchestrated execution configurations that run multiple test suites with specific profiles and settings. This inventory provides comprehensive details about all collections, organized by their content status to help identify configuration issues and optimization opportunities.")
             self._output("")
             
+            # Get count of referenced suites for every collection at once
+            cursor.execute('''
+                SELECT collection_suite_id, COUNT(*) as suite_count
+                FROM test_suite_collection_links
+                GROUP BY collection_suite_id
+            ''')
+            suite_counts = {row['collection_suite_id']: row['suite_count'] for row in cursor}
+            
+            # Look up full test suite paths by suite name in Python rather than joining on the unindexed name column
+            suite_paths_by_name = {}
+            for suite in cursor.execute('SELECT name, relative_path FROM test_suites ORDER BY relative_path'):
+                suite_paths_by_name.setdefault(suite['name'], []).append(suite['relative_path'])
+            
+            # Get collection links for all collections, grouped per collection
+            cursor.execute('''
+                SELECT collection_suite_id, referenced_suite_path, run_enabled, group_name, 
+                       profile_name, require_configuration_data, run_configuration_id
+                FROM test_suite_collection_links
+                ORDER BY collection_suite_id, referenced_suite_path
+            ''')
+            links_by_collection = {}
+            for link in cursor:
+                # One entry per suite sharing the referenced name (None when no suite matches)
+                for full_suite_path in suite_paths_by_name.get(link['referenced_suite_path'], [None]):
+                    links_by_collection.setdefault(link['collection_suite_id'], []).append(
+                        dict(link, full_suite_path=full_suite_path)
+                    )
+            
             # Collect summary data for all collections
             collection_summaries = []
             for collection in collections:
-                # Get count of referenced suites for this collection
-                cursor.execute('''
-                    SELECT COUNT(*) as suite_count
-                    FROM test_suite_collection_links
-                    WHERE collection_suite_id = ?
-                ''', (collection['id'],))
-                
-                suite_count = cursor.fetchone()['suite_count']
+                suite_count = suite_counts.get(collection['id'], 0)
                 
                 collection_summaries.append({
                     'name': collection['name'],
@@ -1061,9 +1182,14 @@ class AutomationProgressReporter:
                     'collection_data': collection
                 })
             
-            # Separate empty and non-empty collections
-            empty_collections = [c for c in collection_summaries if c['suite_count'] == 0]
-            non_empty_collections = [c for c in collection_summaries if c['suite_count'] > 0]
+            # Separate empty and non-empty collections in one pass
+            empty_collections = []
+            non_empty_collections = []
+            for summary in collection_summaries:
+                if summary['suite_count'] == 0:
+                    empty_collections.append(summary)
+                else:
+                    non_empty_collections.append(summary)
             
             # Display empty collections if any exist
             if empty_collections:
@@ -1116,17 +1242,7 @@ class AutomationProgressReporter:
                 self._output("")
                 
                 # Get collection links for this collection with full test suite paths
-                cursor.execute('''
-                    SELECT tscl.referenced_suite_path, tscl.run_enabled, tscl.group_name, tscl.profile_name, 
-                           tscl.require_configuration_data, tscl.run_configuration_id,
-                           ts.relative_path as full_suite_path
-                    FROM test_suite_collection_links tscl
-                    LEFT JOIN test_suites ts ON ts.name = tscl.referenced_suite_path
-                    WHERE tscl.collection_suite_id = ?
-                    ORDER BY tscl.referenced_suite_path
-                ''', (collection['id'],))
-                
-                links = cursor.fetchall()
+                links = links_by_collection.get(collection['id'], [])
                 
                 if links:
                     self._output("**Referenced Test Suites:**")
@@ -1161,7 +1277,18 @@ class AutomationProgressReporter:
         
         else:
             self._output(f"\nComplete Test Suite Collection Inventory:")
-            self._output("=" * 80)
+            self._output(_CONSOLE_RULE)
+            
+            # Get collection links for all collections at once, grouped per collection
+            cursor.execute('''
+                SELECT collection_suite_id, referenced_suite_path, run_enabled, group_name, profile_name, 
+                       require_configuration_data, run_configuration_id
+                FROM test_suite_collection_links
+                ORDER BY collection_suite_id, referenced_suite_path
+            ''')
+            links_by_collection = {}
+            for link in cursor:
+                links_by_collection.setdefault(link['collection_suite_id'], []).append(link)
             
             for collection in collections:
                 self._output(f"\n📦 {collection['name']}")
@@ -1173,15 +1300,7 @@ class AutomationProgressReporter:
                 self._output(f"   Delay Between Instances: {collection['delay_between_instances'] or 0} seconds")
                 
                 # Get collection links for this collection
-                cursor.execute('''
-                    SELECT referenced_suite_path, run_enabled, group_name, profile_name, 
-                           require_configuration_data, run_configuration_id
-                    FROM test_suite_collection_links
-                    WHERE collection_suite_id = ?
-                    ORDER BY referenced_suite_path
-                ''', (collection['id'],))
-                
-                links = cursor.fetchall()
+                links = links_by_collection.get(collection['id'], [])
                 
                 if links:
                     self._output(f"\n   Referenced Test Suites ({len(links)}):")
@@ -1226,139 +1345,67 @@ class AutomationProgressReporter:
         recommendations = []
         
         # Check coverage gaps - use same logic as executive summary
-        total_test_cases = cursor.execute("SELECT COUNT(*) FROM test_cases").fetchone()[0]
+        total_test_cases = self._get_total_test_cases()
         covered_cases = self._get_total_unique_covered_cases()
         uncovered = total_test_cases - covered_cases
         
         if uncovered > 0:
-            # Get the specific uncovered test cases for detailed reporting
-            covered_test_case_ids = set()
-            
-            # Get explicitly covered test case IDs (Test Suite)
-            cursor.execute("""
-                SELECT DISTINCT tscl.test_case_db_id as test_case_id
-                FROM test_suite_case_links tscl 
-                WHERE tscl.test_case_db_id IS NOT NULL
-            """)
-            explicit_ids = {row['test_case_id'] for row in cursor.fetchall()}
-            covered_test_case_ids.update(explicit_ids)
-            
-            # Get dynamically covered test case IDs (Dynamic Test Suite)
-            cursor.execute("""
-                SELECT filtering_text 
-                FROM test_suites 
-                WHERE suite_type = 'FilteringTestSuiteEntity' 
-                AND filtering_text IS NOT NULL AND filtering_text != ''
-            """)
-            filtering_suites = cursor.fetchall()
-            
-            for suite in filtering_suites:
-                criteria = self._parse_filtering_criteria(suite['filtering_text'])
-                if criteria:
-                    test_case_ids = self._get_matching_test_case_ids(criteria)
-                    covered_test_case_ids.update(test_case_ids)
-            
-            # Get uncovered test cases details
-            if covered_test_case_ids:
-                placeholders = ','.join(['?' for _ in covered_test_case_ids])
-                cursor.execute(f"""
-                    SELECT name, tags, relative_path
-                    FROM test_cases 
-                    WHERE id NOT IN ({placeholders})
-                    ORDER BY name
-                """, list(covered_test_case_ids))
-            else:
-                cursor.execute("""
-                    SELECT name, tags, relative_path
-                    FROM test_cases 
-                    ORDER BY name
-                """)
-            
-            uncovered_test_cases = cursor.fetchall()
             recommendations.append(f"🎯 {uncovered} test cases are not included in any test suite - consider creating focused suites")
-
+            
             # Add detailed table of uncovered test cases
-            if self.output_format == 'markdown' and uncovered_test_cases:
-                self._output("")
-                self._output("#### Uncovered Test Cases")
-                self._output("")
-                self._output("Test cases that are not included in any test suite represent potential gaps in automation coverage. These cases may need to be organized into appropriate test suites or evaluated for relevance to current testing strategies.")
-                self._output("")
-                self._output("<details>")
-                self._output(f"<summary><strong>📋 Detailed Uncovered Test Cases</strong> ({len(uncovered_test_cases)} test cases)</summary>")
-                self._output("")
-                self._output("The following test cases are not referenced by any test suite and may require attention:")
-                self._output("")
-                self._output("| Test Case Name | Tags | Path |")
-                self._output("|----------------|------|------|")
-                for test_case in uncovered_test_cases:
-                    tags = test_case['tags'] or 'No tags'
-                    path = test_case['relative_path']
-                    self._output(f"| **{test_case['name']}** | {tags} | `{path}` |")
-                self._output("")
-                self._output("</details>")
-                self._output("")
-        
-        # Check P1 test coverage - use corrected logic for both explicit and filtering coverage
-        cursor.execute("SELECT COUNT(*) as total_p1 FROM test_cases WHERE tags LIKE '%p1%'")
-        total_p1 = cursor.fetchone()['total_p1']
+            if self.output_format == 'markdown':
+                self._output_lines([
+                    "",
+                    "#### Uncovered Test Cases",
+                    "",
+                    "Test cases that are not included in any test suite represent potential gaps in automation coverage. These cases may need to be organized into appropriate test suites or evaluated for relevance to current testing strategies.",
+                    "",
+                    "<details>",
+                    f"<summary><strong>📋 Detailed Uncovered Test Cases</strong> ({uncovered} test cases)</summary>",
+                    "",
+                    "The following test cases are not referenced by any test suite and may require attention:",
+                    "",
+                    "| Test Case Name | Tags | Path |",
+                    "|----------------|------|------|",
+                ])
+                
+                # Reuse the covered set the count above came from instead of re-evaluating
+                # every suite link and Dynamic Test Suite condition in SQL
+                covered_ids = self._get_covered_case_ids()
+                cursor.execute("SELECT id, name, tags, relative_path FROM test_cases ORDER BY name")
+                self._output_lines(
+                    f"| **{name}** | {tags or 'No tags'} | `{relative_path}` |"
+                    for test_case_id, name, tags, relative_path in cursor
+                    if test_case_id not in covered_ids
+                )
+                self._output_lines(["", "</details>", ""])
+        
+        # Check P1 test coverage - use corrected logic for both explicit and filtering coverage,
+        # checking each P1 test case against the cached covered set in the same pass that counts them
+        covered_ids = self._get_covered_case_ids()
+        cursor.execute("""
+            SELECT DISTINCT tct.test_case_id
+            FROM tags t
+            JOIN test_case_tags tct ON tct.tag_id = t.id
+            WHERE t.tag_name = ? COLLATE NOCASE
+        """, ('p1',))
+        total_p1 = 0
+        covered_p1 = 0
+        for (test_case_id,) in cursor:
+            total_p1 += 1
+            covered_p1 += test_case_id in covered_ids
         
         if total_p1 > 0:
-            # Get P1 test case IDs
-            cursor.execute("SELECT id FROM test_cases WHERE tags LIKE '%p1%'")
-            p1_test_ids = {row['id'] for row in cursor.fetchall()}
-            
-            # Get covered test case IDs (both explicit and filtering)
-            cursor.execute("""
-                SELECT DISTINCT tscl.test_case_db_id as test_case_id
-                FROM test_suite_case_links tscl 
-                WHERE tscl.test_case_db_id IS NOT NULL
-            """)
-            explicit_covered_ids = {row['test_case_id'] for row in cursor.fetchall()}
-            
-            # Get filtering covered IDs
-            cursor.execute("""
-                SELECT filtering_text 
-                FROM test_suites 
-                WHERE suite_type = 'FilteringTestSuiteEntity' 
-                AND filtering_text IS NOT NULL AND filtering_text != ''
-            """)
-            filtering_suites = cursor.fetchall()
-            filtering_covered_ids = set()
-            
-            for suite in filtering_suites:
-                criteria = self._parse_filtering_criteria(suite['filtering_text'])
-                if criteria:
-                    test_case_ids = self._get_matching_test_case_ids(criteria)
-                    filtering_covered_ids.update(test_case_ids)
-            
-            # Combine coverage and check P1 overlap
-            all_covered_ids = explicit_covered_ids.union(filtering_covered_ids)
-            covered_p1_ids = p1_test_ids.intersection(all_covered_ids)
-            p1_coverage = (len(covered_p1_ids) / total_p1 * 100)
+            p1_coverage = (covered_p1 / total_p1 * 100)
         else:
             p1_coverage = 0
         
         if p1_coverage < 95:
             recommendations.append(f"⚠️  P1 test coverage is {p1_coverage:.1f}% - ensure critical tests are in smoke/regression suites")
         
-        # Check for data-driven opportunities
-        cursor.execute("""
-            SELECT COUNT(*) as non_data_driven
-            FROM test_cases
-            WHERE has_test_data_links = FALSE AND tags LIKE '%ui%'
-        """)
-        non_data_driven = cursor.fetchone()['non_data_driven']
-
         # Check filtering suite utilization
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_suites,
-                SUM(CASE WHEN suite_type = 'FilteringTestSuiteEntity' THEN 1 ELSE 0 END) as collection_suites
-            FROM test_suites
-        """)
-        suite_data = cursor.fetchone()
-        filtering_percentage = (suite_data['collection_suites'] / suite_data['total_suites'] * 100) if suite_data['total_suites'] > 0 else 0
+        total_suites, filtering_suites = self._get_suite_counts()
+        filtering_percentage = (filtering_suites / total_suites * 100) if total_suites > 0 else 0
         
         if filtering_percentage > 70:
             recommendations.append(f"✅ Excellent use of Dynamic Test Suites ({filtering_percentage:.1f}%) - good automation maturity")
@@ -1368,14 +1415,8 @@ class AutomationProgressReporter:
         if not recommendations:
             recommendations.append("✅ Automation setup looks well-structured - continue monitoring and optimizing")
         
-        if self.output_format == 'markdown':
-            for i, rec in enumerate(recommendations, 1):
-                self._output(f"{i}. {rec}")
-            self._output("")
-        else:
-            for i, rec in enumerate(recommendations, 1):
-                self._output(f"{i}. {rec}")
-            self._output("")
+        self._output_lines(f"{i}. {rec}" for i, rec in enumerate(recommendations, 1))
+        self._output("")
         
     def generate_trend_analysis(self):
         """Generate trend analysis based on timestamps."""
@@ -1435,11 +1476,9 @@ class AutomationProgressReporter:
         metrics = {}
         
         # Basic counts
-        cursor.execute("SELECT COUNT(*) as count FROM test_cases")
-        metrics['total_test_cases'] = cursor.fetchone()['count']
+        metrics['total_test_cases'] = self._get_total_test_cases()
         
-        cursor.execute("SELECT COUNT(*) as count FROM test_suites")
-        metrics['total_test_suites'] = cursor.fetchone()['count']
+        metrics['total_test_suites'] = self._get_suite_counts()[0]
         
         # Coverage metrics - use same calculation as markdown report (includes FilteringTestSuiteEntity)
         metrics['covered_test_cases'] = self._get_total_unique_covered_cases()
@@ -1460,11 +1499,11 @@ class AutomationProgressReporter:
             archive_path = Path(self.archive_folder)
             archive_path.mkdir(exist_ok=True)
             db_name = self.db_path.stem
-            timestamp = datetime.now().strftime('%Y%m%d')
+            timestamp = self._run_timestamp.strftime('%Y%m%d')
             export_file = archive_path / f"{db_name}_metrics_{timestamp}.json"
         else:
             # For single database mode: save in root (legacy behavior for backward compatibility)
-            export_file = self.db_path.parent / f"automation_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            export_file = self.db_path.parent / f"automation_metrics_{self._run_timestamp.strftime('%Y%m%d_%H%M%S')}.json"
         
         with open(export_file, 'w') as f:
             json.dump(metrics, f, indent=2)
@@ -1479,31 +1518,81 @@ class AutomationProgressReporter:
     def generate_full_report(self):
         """Generate the complete automation progress report."""
         try:
-            self.generate_executive_summary()
-            self.analyze_test_automation_maturity()
-            self.analyze_test_coverage_distribution()
-            self.analyze_priority_and_risk()
-            self.analyze_automation_efficiency()
-            self.generate_test_suite_collection_inventory()
-            self.generate_trend_analysis()
-            self.generate_recommendations()
-            self.export_detailed_metrics()
+            sections = [
+                self.generate_executive_summary,
+                self.analyze_test_automation_maturity,
+                self.analyze_test_coverage_distribution,
+                self.analyze_priority_and_risk,
+                self.analyze_automation_efficiency,
+                self.generate_test_suite_collection_inventory,
+                self.generate_trend_analysis,
+                self.generate_recommendations,
+                self.export_detailed_metrics,
+            ]
+            for section in sections:
+                section()
+                # Console output is written once per section rather than once per line
+                self._flush_output()
             
             if self.output_format == 'markdown':
                 self._output("---")
                 self._output("")
-                self._output("✅ **Automation Progress Report Completed**")
+                self._output(_MD_REPORT_COMPLETED)
                 self._save_markdown_report()
             else:
-                self._output("=" * 80)
-                self._output("✅ AUTOMATION PROGRESS REPORT COMPLETED")
-                self._output("=" * 80)
+                self._output(_CONSOLE_RULE)
+                self._output(_CONSOLE_REPORT_COMPLETED)
+                self._output(_CONSOLE_RULE)
+                self._flush_output()
             
         except Exception as e:
+            # Keep whatever the failing section produced ahead of the error message
+            self._flush_output()
             print(f"❌ Error generating report: {e}")
             sys.exit(1)
         finally:
-            self.conn.close()
+            self.close()
+
+
+def _generate_database_report(db_file, module_depth):
+    """Generate the organized markdown report for one database (runs in a worker process).
+    
+    Args:
+        db_file: Path to the SQLite database
+        module_depth: Directory depth level for module extraction
+        
+    Returns:
+        Tuple of (primary_report, archive_folder)
+    """
+    # Extract database name without extension
+    db_name = db_file.stem
+    
+    # Create archive folder
+    archive_folder = f"{db_name}_archived"
+    
+    # Primary report filename (same as db name but .md)
+    primary_report = f"{db_name}.md"
+    
+    # Generate report for this database
+    reporter = AutomationProgressReporter(
+        db_path=db_file, 
+        output_format='markdown',
+        module_depth=module_depth
+    )
+    
+    # Set archive folder for organized JSON export
+    reporter.archive_folder = archive_folder
+    
+    # Generate the report content
+    reporter.generate_full_report()
+    
+    # Save primary report and archived copy
+    reporter._save_markdown_report(
+        custom_filename=primary_report,
+        archive_folder=archive_folder
+    )
+    
+    return primary_report, archive_folder
 
 
 def scan_all_databases(module_depth=2):
@@ -1520,46 +1609,26 @@ def scan_all_databases(module_depth=2):
         print(f"  • {db_file}")
     print()
     
-    for db_file in db_files:
-        print(f"📊 Processing database: {db_file}")
-        
-        # Extract database name without extension
-        db_name = db_file.stem
-        
-        # Create archive folder
-        archive_folder = f"{db_name}_archived"
-        
-        # Primary report filename (same as db name but .md)
-        primary_report = f"{db_name}.md"
-        
-        try:
-            # Generate report for this database
-            reporter = AutomationProgressReporter(
-                db_path=db_file, 
-                output_format='markdown',
-                module_depth=module_depth
-            )
-            
-            # Set archive folder for organized JSON export
-            reporter.archive_folder = archive_folder
-            
-            # Generate the report content
-            reporter.generate_full_report()
-            
-            # Save primary report and archived copy
-            reporter._save_markdown_report(
-                custom_filename=primary_report,
-                archive_folder=archive_folder
-            )
-            
-            print(f"✅ Completed processing: {db_file}")
-            print(f"   📄 Primary report: {primary_report}")
-            print(f"   📁 Archive folder: {archive_folder}/")
-            print()
-            
-        except Exception as e:
-            print(f"❌ Error processing {db_file}: {str(e)}")
-            print()
+    # Each database is reported independently, so process them in parallel worker processes
+    with ProcessPoolExecutor(max_workers=min(len(db_files), os.cpu_count() or 1)) as executor:
+        futures = {}
+        for db_file in db_files:
+            print(f"📊 Processing database: {db_file}")
+            futures[executor.submit(_generate_database_report, db_file, module_depth)] = db_file
+        
+        for future in as_completed(futures):
+            db_file = futures[future]
+            try:
+                primary_report, archive_folder = future.result()
+                
+                print(f"✅ Completed processing: {db_file}")
+                print(f"   📄 Primary report: {primary_report}")
+                print(f"   📁 Archive folder: {archive_folder}/")
+                print()
+                
+            except Exception as e:
+                print(f"❌ Error processing {db_file}: {str(e)}")
+                print()
     
     print("🎉 Multi-database scanning completed!")
 
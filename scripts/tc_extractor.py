@@ -13,18 +13,166 @@ This script parses XML TestCaseEntity files and extracts:
 
 import os
 import sqlite3
-import xml.etree.ElementTree as ET
+try:
+    # libxml2-backed parser with the same ElementTree API; noticeably faster on large projects
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 from pathlib import Path
 import json
 from datetime import datetime
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Number of parsed test cases written per executemany batch; bounds memory on large projects
+INSERT_BATCH_SIZE = 5000
+
+# SQLite limits the number of bound parameters per statement, so large IN lists are chunked
+MAX_IN_PARAMS = 500
+
+# Direct TestCaseEntity children stored as plain text fields
+SCALAR_TAGS = frozenset(('name', 'description', 'tag', 'comment', 'recordOption', 'testCaseGuid'))
+
+# Files handed to each parser process at a time
+PARSE_CHUNK_SIZE = 32
+
+# Without --verbose, progress is reported once per this many files instead of once per file
+PROGRESS_INTERVAL = 500
+
+
+def _get_text(parent, tag_name):
+    """Safely get text content from XML element."""
+    element = parent.find(tag_name)
+    return element.text if element is not None and element.text else ""
+
+
+def _walk_tc_files(directory, relative_dir):
+    """Yield every .tc file below a directory with one scandir pass per directory.
+    
+    Files are yielded in the same order as Path.rglob: a directory's own files first, then
+    each subdirectory depth-first; symlinked directories are not followed.
+    
+    Args:
+        directory (str): Directory to walk
+        relative_dir (str): The same directory relative to the project root
+        
+    Yields:
+        tuple: (file_path, relative_path, mtime)
+    """
+    stack = [(directory, relative_dir)]
+    while stack:
+        current, current_relative = stack.pop()
+        subdirectories = []
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append((entry.path, os.path.join(current_relative, entry.name)))
+                elif os.path.normcase(entry.name).endswith('.tc') and entry.is_file():
+                    yield entry.path, os.path.join(current_relative, entry.name), entry.stat().st_mtime
+        stack.extend(reversed(subdirectories))
+
+
+def _parse_tc_file(tc_file):
+    """Parse a single .tc file into plain, picklable TestCaseEntity data.
+    
+    Runs in parser worker processes, so problems are returned as a message for the
+    main process to print in file order instead of being printed here.
+    
+    Args:
+        tc_file (tuple): (file_path, relative_path, mtime) as yielded by _walk_tc_files
+        
+    Returns:
+        tuple: (data, message); data is None when the file could not be used
+    """
+    file_path, relative_path, mtime = tc_file
+    try:
+        tree = ET.parse(file_path)
+        root = tree.getroot()
+        
+        if root.tag != "TestCaseEntity":
+            return None, f"Warning: {file_path} is not a TestCaseEntity file"
+        
+        # Extract basic fields
+        updated_at = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Read every field in one pass over the root's children; like find(), the first
+        # occurrence of a scalar tag wins
+        scalars = {}
+        link_elements = []
+        variable_elements = []
+        for child in root:
+            tag = child.tag
+            if tag == 'testDataLinks':
+                link_elements.append(child)
+            elif tag == 'variable':
+                variable_elements.append(child)
+            elif tag in SCALAR_TAGS and tag not in scalars:
+                scalars[tag] = child.text or ""
+        
+        data = {
+            'name': scalars.get('name', ""),
+            'description': scalars.get('description', ""),
+            'tags': scalars.get('tag', ""),
+            'comment': scalars.get('comment', ""),
+            # Values repeated across many files are interned, so each parser chunk pickles
+            # them once and the main process holds a single copy
+            'record_option': sys.intern(scalars.get('recordOption', "")),
+            'test_case_guid': scalars.get('testCaseGuid', ""),
+            'relative_path': relative_path,
+            'updated_at': updated_at
+        }
+        
+        # Process tags
+        # Split the tags once; the list is reused for the tag links, and tags_list keeps the JSON
+        # form for compatibility with existing databases and queries
+        tags_list = []
+        if data['tags']:
+            tags_list = [sys.intern(tag) for tag in map(str.strip, data['tags'].split(',')) if tag]
+        data['tag_names'] = tags_list
+        data['tags_list'] = json.dumps(tags_list)
+        
+        # Check for test data links
+        test_data_links = []
+        for link in link_elements:
+            iteration_elem = link.find('iterationEntity')
+            test_data_links.append({
+                'combination_type': sys.intern(_get_text(link, 'combinationType')),
+                'link_id': _get_text(link, 'id'),
+                'iteration_type': sys.intern(_get_text(iteration_elem, 'iterationType')) if iteration_elem is not None else "",
+                'iteration_value': _get_text(iteration_elem, 'value') if iteration_elem is not None else "",
+                'test_data_id': _get_text(link, 'testDataId'),
+            })
+        data['has_test_data_links'] = len(test_data_links) > 0
+        data['test_data_links'] = test_data_links
+        
+        # Check for variables
+        variables = []
+        for var in variable_elements:
+            variables.append({
+                'variable_id': _get_text(var, 'id'),
+                'name': _get_text(var, 'name'),
+                'default_value': _get_text(var, 'defaultValue'),
+                'description': _get_text(var, 'description'),
+                'masked': _get_text(var, 'masked').lower() == 'true',
+            })
+        data['has_variables'] = len(variables) > 0
+        data['variables'] = variables
+        
+        return data, None
+        
+    except ET.ParseError as e:
+        return None, f"Error parsing {file_path}: {e}"
+    except Exception as e:
+        return None, f"Unexpected error parsing {file_path}: {e}"
 
 
 class TestCaseExtractor:
-    def __init__(self, root_dir, db_path="test_cases.db"):
+    def __init__(self, root_dir, db_path="test_cases.db", verbose=False):
         self.root_dir = Path(root_dir)
         self.db_path = db_path
+        self.verbose = verbose  # Print every processed file instead of periodic progress
         self.conn = None
         
     def create_database(self):
@@ -32,6 +180,17 @@ class TestCaseExtractor:
         self.conn = sqlite3.connect(self.db_path)
         cursor = self.conn.cursor()
         
+        # Bulk-load settings for a one-shot, single-writer extraction. The database can always be
+        # rebuilt from the project files, so syncs are skipped entirely. The rollback journal is
+        # kept in memory: unlike WAL, that is not persisted in the database file (and switching
+        # to it also takes a database out of WAL mode)
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA cache_size=-200000")  # ~200 MB
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        
         # Main test cases table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS test_cases (
@@ -103,177 +262,204 @@ class TestCaseExtractor:
         print(f"Database created: {self.db_path}")
     
     def find_tc_files(self):
-        """Find all .tc files in the Test Cases directory."""
+        """Find all .tc files in the Test Cases directory.
+        
+        Returns:
+            list: (file_path, relative_path, mtime) tuples
+        """
         test_cases_dir = self.root_dir / "Test Cases"
         if not test_cases_dir.exists():
             raise FileNotFoundError(f"Test Cases directory not found: {test_cases_dir}")
         
-        tc_files = list(test_cases_dir.rglob("*.tc"))
+        tc_files = list(_walk_tc_files(str(test_cases_dir), "Test Cases"))
         print(f"Found {len(tc_files)} .tc files")
         return tc_files
     
     def parse_tc_file(self, file_path):
         """Parse a single .tc file and extract TestCaseEntity data."""
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            if root.tag != "TestCaseEntity":
-                print(f"Warning: {file_path} is not a TestCaseEntity file")
-                return None
-            
-            # Extract basic fields
-            file_stat = file_path.stat()
-            updated_at = datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-            
-            data = {
-                'name': self.get_text(root, 'name'),
-                'description': self.get_text(root, 'description'),
-                'tags': self.get_text(root, 'tag'),
-                'comment': self.get_text(root, 'comment'),
-                'record_option': self.get_text(root, 'recordOption'),
-                'test_case_guid': self.get_text(root, 'testCaseGuid'),
-                'relative_path': str(file_path.relative_to(self.root_dir)),
-                'updated_at': updated_at
-            }
-            
-            # Process tags
-            tags_list = []
-            if data['tags']:
-                tags_list = [tag.strip() for tag in data['tags'].split(',') if tag.strip()]
-            data['tags_list'] = json.dumps(tags_list)
-            
-            # Check for test data links
-            test_data_links = root.findall('testDataLinks')
-            data['has_test_data_links'] = len(test_data_links) > 0
-            data['test_data_links'] = test_data_links
-            
-            # Check for variables
-            variables = root.findall('variable')
-            data['has_variables'] = len(variables) > 0
-            data['variables'] = variables
-            
-            return data
-            
-        except ET.ParseError as e:
-            print(f"Error parsing {file_path}: {e}")
-            return None
-        except Exception as e:
-            print(f"Unexpected error parsing {file_path}: {e}")
-            return None
+        file_path = Path(file_path)
+        data, message = _parse_tc_file(
+            (str(file_path), str(file_path.relative_to(self.root_dir)), file_path.stat().st_mtime)
+        )
+        if message:
+            print(message)
+        return data
     
     def get_text(self, parent, tag_name):
         """Safely get text content from XML element."""
-        element = parent.find(tag_name)
-        return element.text if element is not None and element.text else ""
+        return _get_text(parent, tag_name)
     
-    def insert_test_case(self, data):
-        """Insert or update test case data in database."""
+    def _get_test_case_ids(self, guids):
+        """Look up the database IDs of stored test cases by GUID.
+        
+        Args:
+            guids (list): Test case GUIDs to look up
+            
+        Returns:
+            dict: GUID -> test case ID for the GUIDs that are already stored
+        """
+        cursor = self.conn.cursor()
+        ids = {}
+        for start in range(0, len(guids), MAX_IN_PARAMS):
+            chunk = guids[start:start + MAX_IN_PARAMS]
+            cursor.execute(
+                f"SELECT test_case_guid, id FROM test_cases WHERE test_case_guid IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            ids.update(cursor.fetchall())
+        return ids
+    
+    def insert_test_cases(self, batch):
+        """Insert or update a batch of parsed test cases with one executemany per table.
+        
+        The batch must not contain the same GUID twice, so every row's related data can be
+        replaced before any of the batch's new related rows are written.
+        
+        Args:
+            batch (list): Parsed test case dicts from parse_tc_file
+            
+        Returns:
+            tuple: (new_records, updated_records)
+        """
         cursor = self.conn.cursor()
+        guids = [data['test_case_guid'] for data in batch]
+        existing_ids = self._get_test_case_ids(guids)
         
-        # Check if test case already exists by GUID
-        cursor.execute('SELECT id FROM test_cases WHERE test_case_guid = ?', (data['test_case_guid'],))
-        existing_record = cursor.fetchone()
-        
-        if existing_record:
-            # Update existing test case
-            test_case_id = existing_record[0]
-            cursor.execute('''
-                UPDATE test_cases SET 
-                name = ?, description = ?, tags = ?, tags_list = ?, comment = ?, 
-                record_option = ?, relative_path = ?, 
-                has_test_data_links = ?, has_variables = ?, updated_at = ?
-                WHERE test_case_guid = ?
-            ''', (
+        # Update existing test cases (matched by GUID), then insert the new ones. An UPSERT would
+        # be one statement, but each conflicting row would still burn an AUTOINCREMENT id
+        cursor.executemany('''
+            UPDATE test_cases SET 
+            name = ?, description = ?, tags = ?, tags_list = ?, comment = ?, 
+            record_option = ?, relative_path = ?, 
+            has_test_data_links = ?, has_variables = ?, updated_at = ?
+            WHERE test_case_guid = ?
+        ''', [
+            (
                 data['name'], data['description'], data['tags'], data['tags_list'],
                 data['comment'], data['record_option'], 
                 data['relative_path'], data['has_test_data_links'], data['has_variables'],
                 data['updated_at'], data['test_case_guid']
-            ))
-            
-            # Clear existing related data to avoid duplicates
-            cursor.execute('DELETE FROM test_case_tags WHERE test_case_id = ?', (test_case_id,))
-            cursor.execute('DELETE FROM test_data_links WHERE test_case_id = ?', (test_case_id,))
-            cursor.execute('DELETE FROM test_variables WHERE test_case_id = ?', (test_case_id,))
-            
-        else:
-            # Insert new test case record
-            cursor.execute('''
-                INSERT INTO test_cases 
-                (name, description, tags, tags_list, comment, record_option, 
-                 test_case_guid, relative_path, has_test_data_links, has_variables, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            )
+            for data in batch if data['test_case_guid'] in existing_ids
+        ])
+        cursor.executemany('''
+            INSERT INTO test_cases 
+            (name, description, tags, tags_list, comment, record_option, 
+             test_case_guid, relative_path, has_test_data_links, has_variables, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (
                 data['name'], data['description'], data['tags'], data['tags_list'],
                 data['comment'], data['record_option'], data['test_case_guid'],
                 data['relative_path'], 
                 data['has_test_data_links'], data['has_variables'], data['updated_at']
-            ))
+            )
+            for data in batch if data['test_case_guid'] not in existing_ids
+        ])
+        test_case_ids = self._get_test_case_ids(guids)
+        
+        # Clear existing related data of updated test cases to avoid duplicates
+        updated_ids = [(existing_ids[guid],) for guid in guids if guid in existing_ids]
+        cursor.executemany('DELETE FROM test_case_tags WHERE test_case_id = ?', updated_ids)
+        cursor.executemany('DELETE FROM test_data_links WHERE test_case_id = ?', updated_ids)
+        cursor.executemany('DELETE FROM test_variables WHERE test_case_id = ?', updated_ids)
+        
+        # Collect related rows in file order; the stored content is unchanged from row-at-a-time inserts
+        tag_names = {}
+        case_tags = []
+        data_link_rows = []
+        variable_rows = []
+        for data in batch:
+            test_case_id = test_case_ids[data['test_case_guid']]
+            
+            # Process tags (a tag repeated within one test case is linked once)
+            for tag in dict.fromkeys(data['tag_names']):
+                tag_names[tag] = None
+                case_tags.append((test_case_id, tag))
             
-            test_case_id = cursor.lastrowid
+            # Process test data links
+            data_link_rows.extend(
+                (test_case_id, link['combination_type'], link['link_id'], link['iteration_type'],
+                 link['iteration_value'], link['test_data_id'])
+                for link in data['test_data_links']
+            )
+            
+            # Process variables
+            variable_rows.extend(
+                (test_case_id, var['variable_id'], var['name'], var['default_value'],
+                 var['description'], var['masked'])
+                for var in data['variables']
+            )
         
-        # Process tags
-        if data['tags']:
-            tags_list = [tag.strip() for tag in data['tags'].split(',') if tag.strip()]
-            for tag in tags_list:
-                # Insert or update tag (only increment count for new test cases)
-                cursor.execute('''
-                    INSERT OR IGNORE INTO tags (tag_name, usage_count) VALUES (?, 1)
-                ''', (tag,))
-                
-                # Only increment usage count if this is a new test case
-                if not existing_record:
-                    cursor.execute('''
-                        UPDATE tags SET usage_count = usage_count + 1 WHERE tag_name = ?
-                    ''', (tag,))
-                
-                # Get tag ID and create relationship
-                cursor.execute('SELECT id FROM tags WHERE tag_name = ?', (tag,))
-                tag_id = cursor.fetchone()[0]
-                
-                cursor.execute('''
-                    INSERT INTO test_case_tags (test_case_id, tag_id) 
-                    VALUES (?, ?)
-                ''', (test_case_id, tag_id))
-        
-        # Process test data links
-        if data['has_test_data_links']:
-            for link in data['test_data_links']:
-                combination_type = self.get_text(link, 'combinationType')
-                link_id = self.get_text(link, 'id')
-                test_data_id = self.get_text(link, 'testDataId')
-                
-                iteration_elem = link.find('iterationEntity')
-                iteration_type = ""
-                iteration_value = ""
-                if iteration_elem is not None:
-                    iteration_type = self.get_text(iteration_elem, 'iterationType')
-                    iteration_value = self.get_text(iteration_elem, 'value')
-                
-                cursor.execute('''
-                    INSERT INTO test_data_links 
-                    (test_case_id, combination_type, link_id, iteration_type, 
-                     iteration_value, test_data_id)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (test_case_id, combination_type, link_id, iteration_type, 
-                      iteration_value, test_data_id))
-        
-        # Process variables
-        if data['has_variables']:
-            for var in data['variables']:
-                variable_id = self.get_text(var, 'id')
-                name = self.get_text(var, 'name')
-                default_value = self.get_text(var, 'defaultValue')
-                description = self.get_text(var, 'description')
-                masked = self.get_text(var, 'masked').lower() == 'true'
-                
-                cursor.execute('''
-                    INSERT INTO test_variables 
-                    (test_case_id, variable_id, name, default_value, description, masked)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (test_case_id, variable_id, name, default_value, description, masked))
+        # Unique tags of the batch in first-seen order; usage counts are recomputed after the load
+        cursor.executemany('''
+            INSERT OR IGNORE INTO tags (tag_name) VALUES (?)
+        ''', [(tag,) for tag in tag_names])
+        cursor.executemany('''
+            INSERT INTO test_case_tags (test_case_id, tag_id) 
+            SELECT ?, id FROM tags WHERE tag_name = ?
+        ''', case_tags)
+        
+        cursor.executemany('''
+            INSERT INTO test_data_links 
+            (test_case_id, combination_type, link_id, iteration_type, 
+             iteration_value, test_data_id)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', data_link_rows)
         
-        return existing_record is not None
+        cursor.executemany('''
+            INSERT INTO test_variables 
+            (test_case_id, variable_id, name, default_value, description, masked)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', variable_rows)
+        
+        return len(batch) - len(updated_ids), len(updated_ids)
+    
+    def _flush_batch(self, batch, duplicates=None):
+        """Write a batch of parsed test cases, retrying row by row if the batch fails.
+        
+        A failed batch is rolled back and written again one test case at a time, so only the
+        test cases that actually fail are skipped and counted as errors.
+        
+        Args:
+            batch (list): Parsed test case dicts with unique GUIDs
+            duplicates (dict): GUID -> number of files folded into the batch because they
+                repeated that GUID; each counts as an updated record (or an error)
+            
+        Returns:
+            tuple: (new_records, updated_records, errors)
+        """
+        if not batch:
+            return 0, 0, 0
+        duplicates = duplicates or {}
+        
+        cursor = self.conn.cursor()
+        cursor.execute("SAVEPOINT test_case_batch")
+        try:
+            new_records, updated_records = self.insert_test_cases(batch)
+        except Exception:
+            cursor.execute("ROLLBACK TO test_case_batch")
+            cursor.execute("RELEASE test_case_batch")
+        else:
+            cursor.execute("RELEASE test_case_batch")
+            return new_records, updated_records + sum(duplicates.values()), 0
+        
+        new_records = updated_records = errors = 0
+        for data in batch:
+            folded = duplicates.get(data['test_case_guid'], 0)
+            cursor.execute("SAVEPOINT test_case_row")
+            try:
+                new_record, updated_record = self.insert_test_cases([data])
+            except Exception as e:
+                cursor.execute("ROLLBACK TO test_case_row")
+                print(f"Error inserting {data['relative_path']}: {e}")
+                errors += 1 + folded
+            else:
+                new_records += new_record
+                updated_records += updated_record + folded
+            cursor.execute("RELEASE test_case_row")
+        
+        return new_records, updated_records, errors
     
     def get_directory_distribution(self, depth=2, base_path="Test Cases"):
         """
@@ -287,37 +473,43 @@ class TestCaseExtractor:
             list: Sorted list of (directory_path, count) tuples
         """
         cursor = self.conn.cursor()
-        cursor.execute('SELECT relative_path FROM test_cases')
-        paths = cursor.fetchall()
-        
-        directory_counts = {}
-        base_path_with_slash = f"{base_path}/"
-        base_path_len = len(base_path_with_slash)
-        
-        for (path,) in paths:
-            if path.startswith(base_path_with_slash):
-                # Remove base path prefix and split by '/'
-                remaining_path = path[base_path_len:]
-                parts = remaining_path.split('/')
-                
-                # Build directory path based on requested depth
-                if len(parts) >= depth:
-                    # Take exactly 'depth' levels
-                    directory_parts = parts[:depth]
-                    directory = f"{base_path}/" + "/".join(directory_parts)
-                elif len(parts) > 0:
-                    # Take all available parts if less than requested depth
-                    directory = f"{base_path}/" + "/".join(parts[:-1]) if len(parts) > 1 else f"{base_path}/{parts[0]}"
-                else:
-                    directory = base_path
-                
-                directory_counts[directory] = directory_counts.get(directory, 0) + 1
-            else:
-                # Handle paths that don't start with base_path
-                directory_counts[path] = directory_counts.get(path, 0) + 1
         
-        # Sort by count descending
-        return sorted(directory_counts.items(), key=lambda x: x[1], reverse=True)
+        # Walk each path below base_path one directory at a time (at most 'depth' steps) and group
+        # on the resulting directory in SQLite. A path that runs out of directories before 'depth'
+        # keeps its file name when it is exactly one level short, like the slice it replaces.
+        cursor.execute('''
+            WITH RECURSIVE walk(id, dir, rest, levels) AS (
+                SELECT id, '', substr(relative_path, length(:prefix) + 1), 0
+                FROM test_cases
+                WHERE substr(relative_path, 1, length(:prefix)) = :prefix
+                UNION ALL
+                SELECT id, dir || '/' || substr(rest, 1, instr(rest, '/') - 1),
+                       substr(rest, instr(rest, '/') + 1), levels + 1
+                FROM walk
+                WHERE levels < :depth AND instr(rest, '/') > 0
+            ),
+            directories(id, directory) AS (
+                SELECT id,
+                    CASE
+                        WHEN levels = :depth THEN :base || dir
+                        WHEN levels = :depth - 1 OR levels = 0 THEN :base || dir || '/' || rest
+                        ELSE :base || dir
+                    END
+                FROM walk
+                WHERE levels = :depth OR instr(rest, '/') = 0
+                UNION ALL
+                SELECT id, relative_path
+                FROM test_cases
+                WHERE substr(relative_path, 1, length(:prefix)) != :prefix
+            )
+            SELECT directory, COUNT(*) as count
+            FROM directories
+            GROUP BY directory
+            ORDER BY count DESC, MIN(id)
+        ''', {'base': base_path, 'prefix': f"{base_path}/", 'depth': depth})
+        
+        # Sorted by count descending
+        return cursor.fetchall()
     
     def extract_all(self):
         """Extract all test cases and store in database."""
@@ -329,27 +521,56 @@ class TestCaseExtractor:
         # Find all .tc files
         tc_files = self.find_tc_files()
         
-        # Process each file
+        # Process each file; parsed test cases are written in batches inside one transaction
         processed = 0
         updated = 0
         errors = 0
+        batch = {}  # GUID -> parsed test case, in first-seen order
+        batch_duplicates = {}  # GUID -> files folded into the pending batch
         
-        for file_path in tc_files:
-            print(f"Processing: {file_path.relative_to(self.root_dir)}")
-            
-            data = self.parse_tc_file(file_path)
-            if data:
-                try:
-                    is_update = self.insert_test_case(data)
-                    if is_update:
-                        updated += 1
-                    else:
-                        processed += 1
-                except Exception as e:
-                    print(f"Error inserting {file_path}: {e}")
+        self.conn.execute("BEGIN IMMEDIATE")
+        # XML parsing fans out across CPUs; results come back in file order and all SQLite
+        # writes stay in this process
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_parse_tc_file, tc_files, chunksize=PARSE_CHUNK_SIZE)
+            for count, ((_, relative_path, _), (data, message)) in enumerate(zip(tc_files, results), 1):
+                if self.verbose:
+                    print(f"Processing: {relative_path}")
+                elif count % PROGRESS_INTERVAL == 0 or count == len(tc_files):
+                    print(f"Processed {count}/{len(tc_files)} files")
+                if message:
+                    print(message)
+                
+                if data:
+                    if len(batch) >= INSERT_BATCH_SIZE:
+                        new_records, updated_records, batch_errors = self._flush_batch(
+                            list(batch.values()), batch_duplicates
+                        )
+                        processed += new_records
+                        updated += updated_records
+                        errors += batch_errors
+                        batch = {}
+                        batch_duplicates = {}
+                    
+                    # A repeated GUID updates the earlier file's record, so the later file simply
+                    # replaces it in the pending batch (keeping the earlier file's position)
+                    if data['test_case_guid'] in batch:
+                        batch_duplicates[data['test_case_guid']] = batch_duplicates.get(data['test_case_guid'], 0) + 1
+                    batch[data['test_case_guid']] = data
+                else:
                     errors += 1
-            else:
-                errors += 1
+        
+        new_records, updated_records, batch_errors = self._flush_batch(list(batch.values()), batch_duplicates)
+        processed += new_records
+        updated += updated_records
+        errors += batch_errors
+        
+        # Count tag usage once from the relationship table instead of incrementing per test case
+        self.conn.execute('''
+            UPDATE tags SET usage_count = (
+                SELECT COUNT(*) FROM test_case_tags WHERE tag_id = tags.id
+            )
+        ''')
         
         self.conn.commit()
         print(f"\nExtraction complete!")
@@ -427,6 +648,11 @@ def main():
         default=None,
         help="Path for the output SQLite database (default: <project_folder_name>.db)"
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print every processed file instead of periodic progress"
+    )
     
     args = parser.parse_args()
     
@@ -450,7 +676,7 @@ def main():
         sys.exit(1)
     
     # Create extractor and run
-    extractor = TestCaseExtractor(project_path, db_name)
+    extractor = TestCaseExtractor(project_path, db_name, verbose=args.verbose)
     
     try:
         extractor.extract_all()
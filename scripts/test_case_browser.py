@@ -10,11 +10,30 @@ Usage: python3 test_case_browser.py [database_path] [--module-depth DEPTH] [--ou
 
 import sqlite3
 import argparse
+import io
 import json
+import re
+import shutil
 from datetime import datetime
 from pathlib import Path
 import sys
 
+# Marker that starts the steps section of a test case description
+_STEPS_RE = re.compile(r'Steps?:')
+
+# Number of test case rows fetched from SQLite per round trip
+FETCH_BATCH_SIZE = 1024
+
+# Write buffer size for the markdown report file
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Connection tuning for the read-only table scans done by the browser
+BROWSER_PRAGMAS = [
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # Read up to 256 MiB of the file through memory mapping
+]
+
 
 class TestCaseBrowser:
     """Browse and display test cases grouped by folder structure."""
@@ -33,37 +52,42 @@ class TestCaseBrowser:
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {db_path}")
         
-        self.conn = sqlite3.connect(db_path)
+        # The browser never writes, so open the file read-only
+        self.conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, cached_statements=256)
         self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        for pragma in BROWSER_PRAGMAS:
+            self.conn.execute(pragma)
         self.output_format = output_format
         self.module_depth = module_depth
-        self.report_content = []  # Store report content for markdown output
+        self._report_buffer = io.StringIO()  # Store report content for markdown output
+        self._line_separator = ''  # Written before each buffered line; empty until the first one
+        self._folder_path_cache = {}  # Directory -> folder path at the configured depth
     
     def _output(self, text):
         """Output text to console or store for markdown."""
         if self.output_format == 'console':
             print(text)
         else:
-            self.report_content.append(text)
+            self._report_buffer.write(self._line_separator)
+            self._report_buffer.write(text)
+            self._line_separator = '\n'
     
     def _save_markdown_report(self, filename=None):
         """Save accumulated report content to markdown file."""
         if self.output_format == 'markdown':
             if filename:
-                markdown_file = Path(filename)
-                with open(markdown_file, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(self.report_content))
-                print(f"📄 Test case browser report saved to: {markdown_file}")
-                return markdown_file
+                markdown_file = filename
             else:
                 # Auto-generate filename based on database name
                 db_stem = self.db_path.stem
-                auto_filename = f"{db_stem}_list_test_cases.md"
-                markdown_file = Path(auto_filename)
-                with open(markdown_file, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(self.report_content))
-                print(f"📄 Test case browser report saved to: {markdown_file}")
-                return markdown_file
+                markdown_file = f"{db_stem}_list_test_cases.md"
+            
+            # Copy the buffer in chunks instead of materializing it as one string
+            self._report_buffer.seek(0)
+            with open(markdown_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                shutil.copyfileobj(self._report_buffer, f, WRITE_BUFFER_SIZE)
+            print(f"📄 Test case browser report saved to: {markdown_file}")
+            return markdown_file
     
     def _extract_module_path_from_path(self, relative_path):
         """Extract full directory path from relative path based on configured depth.
@@ -82,13 +106,24 @@ class TestCaseBrowser:
         if not relative_path or not relative_path.startswith('Test Cases/'):
             return 'Other'
         
-        # Split path
-        path_parts = relative_path.split('/')
-        if len(path_parts) < 2:
-            return 'Other'
-        
-        # Remove the .tc file from consideration (last element if it ends with .tc)
-        directory_parts = path_parts[:-1] if path_parts[-1].endswith('.tc') else path_parts
+        # Remove the .tc file from consideration; test cases in the same directory
+        # always map to the same folder, so the result is cached per directory.
+        # This runs once per test case: keep it on plain str methods, not pathlib.
+        directory, _, file_name = relative_path.rpartition('/')
+        if not file_name.endswith('.tc'):
+            directory = relative_path
+        
+        folder_path = self._folder_path_cache.get(directory)
+        if folder_path is None:
+            # Directories under the same folder share one interned string for the grouping key
+            folder_path = sys.intern(self._folder_path_for_directory(directory))
+            self._folder_path_cache[directory] = folder_path
+        return folder_path
+    
+    def _folder_path_for_directory(self, directory):
+        """Truncate a directory path like 'Test Cases/Platform/Admin' to the configured depth."""
+        # Only the first module_depth + 1 segments can end up in the result
+        directory_parts = directory.split('/', self.module_depth + 1)
         
         # Calculate available directory depth (excluding 'Test Cases' at index 0)
         available_depth = len(directory_parts) - 1
@@ -105,6 +140,7 @@ class TestCaseBrowser:
     def _get_test_cases_by_folder(self):
         """Get all test cases grouped by folder path."""
         cursor = self.conn.cursor()
+        cursor.arraysize = FETCH_BATCH_SIZE
         
         # Get all test cases with their details
         cursor.execute("""
@@ -119,138 +155,55 @@ class TestCaseBrowser:
                 updated_at,
                 created_at
             FROM test_cases
-            ORDER BY relative_path, name
+            ORDER BY name, relative_path
         """)
         
-        test_cases = cursor.fetchall()
-        
-        # Group by folder path
+        # Group by folder path, streaming rows in batches instead of loading the whole table;
+        # rows arrive sorted by name, so every folder's list is already in display order
         folder_groups = {}
         
-        for test_case in test_cases:
-            # Extract the directory path up to the configured depth
-            folder_path = self._extract_module_path_from_path(test_case['relative_path'])
+        while True:
+            test_cases = cursor.fetchmany()
+            if not test_cases:
+                break
             
-            if folder_path not in folder_groups:
-                folder_groups[folder_path] = []
-            
-            # Add test case details to the folder group
-            folder_groups[folder_path].append({
-                'id': test_case['id'],
-                'name': test_case['name'],
-                'description': test_case['description'] or '',
-                'tags': test_case['tags'] or '',
-                'relative_path': test_case['relative_path'],
-                'has_variables': test_case['has_variables'],
-                'has_test_data_links': test_case['has_test_data_links'],
-                'updated_at': test_case['updated_at'],
-                'created_at': test_case['created_at']
-            })
+            for test_case in test_cases:
+                # Extract the directory path up to the configured depth
+                folder_path = self._extract_module_path_from_path(test_case['relative_path'])
+                
+                if folder_path not in folder_groups:
+                    folder_groups[folder_path] = []
+                
+                # Keep the sqlite3.Row itself; it already supports access by column name
+                folder_groups[folder_path].append(test_case)
         
         return folder_groups
     
-    def _get_test_suite_coverage_for_case(self, test_case_id):
-        """Get test suite coverage information for a specific test case."""
-        cursor = self.conn.cursor()
-        
-        # Get explicit test suite links
-        cursor.execute("""
-            SELECT DISTINCT
-                ts.name as suite_name,
-                ts.suite_type_alias,
-                ts.relative_path as suite_path
-            FROM test_suite_case_links tscl
-            JOIN test_suites ts ON tscl.test_suite_id = ts.id
-            WHERE tscl.test_case_db_id = ?
-            ORDER BY ts.name
-        """, (test_case_id,))
-        
-        explicit_suites = cursor.fetchall()
-        
-        # Check for dynamic test suite coverage (filtering suites)
-        cursor.execute("""
-            SELECT name, tags FROM test_cases WHERE id = ?
-        """, (test_case_id,))
+    @staticmethod
+    def _clean_description(description, limit):
+        """Remove the steps section from a description and truncate it.
         
-        test_case_info = cursor.fetchone()
-        if not test_case_info:
-            return explicit_suites
-        
-        # Get all filtering test suites to check if this test case matches
-        cursor.execute("""
-            SELECT 
-                ts.name as suite_name,
-                ts.suite_type_alias,
-                ts.relative_path as suite_path,
-                ts.filtering_text
-            FROM test_suites ts
-            WHERE ts.suite_type = 'FilteringTestSuiteEntity' 
-            AND ts.filtering_text IS NOT NULL AND ts.filtering_text != ''
-        """)
-        
-        filtering_suites = cursor.fetchall()
-        dynamic_matches = []
-        
-        for suite in filtering_suites:
-            if self._test_case_matches_filter(test_case_info, suite['filtering_text']):
-                dynamic_matches.append({
-                    'suite_name': suite['suite_name'],
-                    'suite_type_alias': suite['suite_type_alias'],
-                    'suite_path': suite['suite_path']
-                })
-        
-        # Combine explicit and dynamic matches
-        all_suites = list(explicit_suites) + dynamic_matches
-        return all_suites
-    
-    def _test_case_matches_filter(self, test_case_info, filtering_text):
-        """Check if a test case matches the filtering criteria."""
-        if not filtering_text:
-            return False
-        
-        criteria = self._parse_filtering_criteria(filtering_text)
-        if not criteria:
-            return False
-        
-        # Check name criteria
-        if 'name' in criteria:
-            name_match = False
-            for name_pattern in criteria['name']:
-                if name_pattern and test_case_info['name'].startswith(name_pattern):
-                    name_match = True
-                    break
-            if not name_match:
-                return False
-        
-        # Check tag criteria
-        if 'tag' in criteria:
-            test_tags = test_case_info['tags'] or ''
-            test_tag_list = [tag.strip() for tag in test_tags.split(',') if tag.strip()]
+        Args:
+            description: Test case description text
+            limit: Maximum number of characters to keep before adding '...'
             
-            for required_tag in criteria['tag']:
-                if required_tag and required_tag not in test_tag_list:
-                    return False
-        
-        return True
-    
-    def _parse_filtering_criteria(self, filtering_text):
-        """Parse filtering text from Dynamic Test Suite to extract criteria."""
-        if not filtering_text:
-            return {}
-        
-        import re
-        criteria = {}
+        Returns:
+            Main description text without the 'Steps:'/'Step:' section
+        """
+        # Empty or NULL descriptions skip the marker search and truncation
+        if not description:
+            return ""
         
-        # Pattern to match name=(value) or tag=(value1,value2)
-        pattern = r'(\w+)=\(([^)]*)\)'
-        matches = re.findall(pattern, filtering_text)
+        # Everything from the first 'Steps:' or 'Step:' marker onwards is dropped
+        match = _STEPS_RE.search(description)
+        if match:
+            description = description[:match.start()].strip()
         
-        for key, value in matches:
-            values = [v.strip() for v in value.split(',') if v.strip()]
-            if values:
-                criteria[key] = values
+        # Truncate if too long
+        if len(description) > limit:
+            description = description[:limit] + "..."
         
-        return criteria
+        return description
     
     def generate_test_case_browser_report(self):
         """Generate the main test case browser report."""
@@ -295,23 +248,14 @@ class TestCaseBrowser:
                 self._output("| Test Case | Description | Tags |")
                 self._output("|-----------|-------------|------|")
                 
-                for test_case in sorted(test_cases, key=lambda x: x['name']):
+                # Format the folder's rows first and emit the table body in one call
+                table_rows = []
+                for test_case in test_cases:
                     # Prepare table data
                     name = test_case['name']
                     
                     # Clean description - remove steps and keep only main description
-                    description = test_case['description']
-                    if description:
-                        # Remove steps section if present
-                        if 'Steps:' in description:
-                            description = description.split('Steps:')[0].strip()
-                        if 'Step:' in description:
-                            description = description.split('Step:')[0].strip()
-                        # Truncate if too long
-                        if len(description) > 150:
-                            description = description[:150] + "..."
-                    else:
-                        description = ""
+                    description = self._clean_description(test_case['description'], 150)
                     
                     tags = test_case['tags'] if test_case['tags'] else ""
                     
@@ -319,8 +263,10 @@ class TestCaseBrowser:
                     description = description.replace('|', '\\|').replace('\n', ' ')
                     tags = tags.replace('|', '\\|')
                     
-                    self._output(f"| **{name}** | {description} | `{tags}` |")
+                    table_rows.append(f"| **{name}** | {description} | `{tags}` |")
                 
+                if table_rows:
+                    self._output("\n".join(table_rows))
                 self._output("")
                 self._output("</details>")
                 self._output("")
@@ -335,20 +281,12 @@ class TestCaseBrowser:
                 self._output(f"📁 {folder_path} ({len(test_cases)} test cases)")
                 self._output("-" * (len(folder_path) + 20))
                 
-                for i, test_case in enumerate(sorted(test_cases, key=lambda x: x['name']), 1):
+                for i, test_case in enumerate(test_cases, 1):
                     self._output(f"  {i:>2}. {test_case['name']}")
                     
                     # Clean description - remove steps and keep only main description
-                    description = test_case['description']
-                    if description:
-                        # Remove steps section if present
-                        if 'Steps:' in description:
-                            description = description.split('Steps:')[0].strip()
-                        if 'Step:' in description:
-                            description = description.split('Step:')[0].strip()
-                        # Truncate if too long
-                        if len(description) > 100:
-                            description = description[:100] + "..."
+                    if test_case['description']:
+                        description = self._clean_description(test_case['description'], 100)
                         self._output(f"      Description: {description}")
                     
                     if test_case['tags']:
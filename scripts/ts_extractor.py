@@ -14,27 +14,278 @@ This script parses XML TestSuiteEntity, FilteringTestSuiteEntity, and TestSuiteC
 
 import os
 import sqlite3
-import xml.etree.ElementTree as ET
+import hashlib
+try:
+    # libxml2-backed parser with the same ElementTree API; noticeably faster on large projects
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 from pathlib import Path
 import json
-from datetime import datetime
 import sys
 import argparse
 import re
+import string
+import time
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Files handed to each parser process at a time
+PARSE_CHUNK_SIZE = 32
+
+# Without --verbose, progress is reported once per this many files instead of once per file
+PROGRESS_INTERVAL = 500
+
+# Boolean field values as Katalon writes them
+_BOOLEAN_TEXT = {'true': True, 'false': False, '': False}
+
+# Pattern to match name=(value) or tag=(value1,value2) in Dynamic Test Suite filtering text
+_FILTERING_CRITERIA_RE = re.compile(r'(\w+)=\(([^)]*)\)')
+
+# Case folding of SQLite's NOCASE collation (ASCII letters only), used to compare tag names
+_NOCASE_FOLD = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _get_text(parent, tag_name):
+    """Safely get text content from XML element."""
+    return parent.findtext(tag_name, "")
+
+
+def _is_true(text):
+    """Interpret a Katalon boolean field, which is 'true' in any letter case when set."""
+    # Exact spellings skip the lower() copy; anything else falls back to the full check
+    value = _BOOLEAN_TEXT.get(text)
+    return text.lower() == 'true' if value is None else value
+
+
+@lru_cache(maxsize=4096)
+def _format_mtime(seconds):
+    """Format a file modification time (whole seconds) as a local timestamp string.
+    
+    Suites saved together share the same second, so the formatted value is cached.
+    """
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(seconds))
+
+
+@lru_cache(maxsize=256)
+def _filtering_where_template(name_count, tag_count):
+    """Build the test_cases WHERE clause for a filtering criteria shape.
+    
+    The SQL only depends on how many name patterns and tags there are, so criteria of the
+    same shape share one string and hit the same entry in SQLite's statement cache.
+    """
+    where_conditions = []
+    if name_count:
+        where_conditions.append(f"({' OR '.join(['name LIKE ?'] * name_count)})")
+    if tag_count:
+        where_conditions.append(f"""id IN (
+                SELECT tct.test_case_id
+                FROM test_case_tags tct
+                JOIN tags t ON t.id = tct.tag_id
+                WHERE t.tag_name COLLATE NOCASE IN ({', '.join('?' * tag_count)})
+                GROUP BY tct.test_case_id
+                HAVING COUNT(DISTINCT t.tag_name COLLATE NOCASE) = ?
+            )""")
+    return ' AND '.join(where_conditions)
+
+
+def _walk_ts_files(directory, relative_dir):
+    """Yield every .ts file below a directory with one scandir pass per directory.
+    
+    Files are yielded in the same order as Path.rglob: a directory's own files first, then
+    each subdirectory depth-first; symlinked directories are not followed.
+    
+    Args:
+        directory (str): Directory to walk
+        relative_dir (str): The same directory relative to the project root
+        
+    Yields:
+        tuple: (file_path, relative_path, mtime)
+    """
+    stack = [(directory, relative_dir)]
+    while stack:
+        current, current_relative = stack.pop()
+        subdirectories = []
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append((entry.path, os.path.join(current_relative, entry.name)))
+                elif os.path.normcase(entry.name).endswith('.ts') and entry.is_file():
+                    yield entry.path, os.path.join(current_relative, entry.name), entry.stat().st_mtime
+        stack.extend(reversed(subdirectories))
+
+
+def _parse_ts_file(ts_file):
+    """Parse a single .ts file into plain, picklable test suite data.
+    
+    Handles TestSuiteEntity, FilteringTestSuiteEntity and TestSuiteCollectionEntity files.
+    Runs in parser worker processes, so problems are returned as a message for the
+    main process to print in file order instead of being printed here.
+    
+    Args:
+        ts_file (tuple): (file_path, relative_path, mtime) as yielded by _walk_ts_files
+        
+    Returns:
+        tuple: (data, message); data is None when the file could not be used
+    """
+    file_path, relative_path, mtime = ts_file
+    try:
+        tree = ET.parse(file_path)
+        root = tree.getroot()
+        
+        if root.tag not in ["TestSuiteEntity", "FilteringTestSuiteEntity", "TestSuiteCollectionEntity"]:
+            return None, f"Warning: {file_path} is not a TestSuiteEntity, FilteringTestSuiteEntity, or TestSuiteCollectionEntity file"
+        
+        # Extract file metadata
+        updated_at = _format_mtime(int(mtime))
+        
+        # Map suite types to UI-friendly aliases
+        suite_type_mapping = {
+            'TestSuiteEntity': 'Test Suite',
+            'FilteringTestSuiteEntity': 'Dynamic Test Suite',
+            'TestSuiteCollectionEntity': 'Test Suite Collection'
+        }
+        
+        # Extract basic fields (common to all types)
+        data = {
+            'name': _get_text(root, 'name'),
+            'description': _get_text(root, 'description'),
+            'tags': _get_text(root, 'tag'),
+            'suite_type': root.tag,
+            'suite_type_alias': suite_type_mapping.get(root.tag, root.tag),
+            'relative_path': relative_path,
+            'updated_at': updated_at
+        }
+        
+        # Handle testSuiteGuid - TestSuiteCollectionEntity files don't have this field
+        if root.tag == "TestSuiteCollectionEntity":
+            # Generate a unique identifier for TestSuiteCollectionEntity based on file path; the
+            # digest must stay MD5 so re-runs keep matching collections stored by earlier runs
+            file_hash = hashlib.md5(file_path.encode()).hexdigest()[:8]
+            data['test_suite_guid'] = f"collection_{file_hash}"
+        else:
+            data['test_suite_guid'] = _get_text(root, 'testSuiteGuid')
+        
+        # Extract type-specific fields
+        if root.tag in ["TestSuiteEntity", "FilteringTestSuiteEntity"]:
+            # Fields specific to TestSuiteEntity and FilteringTestSuiteEntity
+            data.update({
+                'is_rerun': _is_true(_get_text(root, 'isRerun')),
+                'mail_recipient': _get_text(root, 'mailRecipient'),
+                'number_of_rerun': int(_get_text(root, 'numberOfRerun') or 0),
+                'page_load_timeout': int(_get_text(root, 'pageLoadTimeout') or 30),
+                'page_load_timeout_default': _is_true(_get_text(root, 'pageLoadTimeoutDefault')),
+                'rerun_failed_test_cases_only': _is_true(_get_text(root, 'rerunFailedTestCasesOnly')),
+                'rerun_immediately': _is_true(_get_text(root, 'rerunImmediately'))
+            })
+        elif root.tag == "TestSuiteCollectionEntity":
+            # Fields specific to TestSuiteCollectionEntity
+            data.update({
+                'delay_between_instances': int(_get_text(root, 'delayBetweenInstances') or 0),
+                'execution_mode': _get_text(root, 'executionMode'),
+                'max_concurrent_instances': int(_get_text(root, 'maxConcurrentInstances') or 1)
+            })
+        
+        # Split the tags once; the list is reused for the tag links, and tags_list keeps the JSON
+        tags_list = []
+        if data['tags']:
+            tags_list = [tag for tag in map(str.strip, data['tags'].split(',')) if tag]
+        data['tag_names'] = tags_list
+        data['tags_list'] = json.dumps(tags_list)
+        
+        # Extract filtering-specific fields for FilteringTestSuiteEntity
+        if root.tag == "FilteringTestSuiteEntity":
+            data['filtering_text'] = _get_text(root, 'filteringText')
+            data['filtering_built_in'] = _get_text(root, 'filteringBuiltIn')
+            data['filtering_extension'] = _get_text(root, 'filteringExtension')
+            data['filtering_plugin'] = _get_text(root, 'filteringPlugin')
+        else:
+            data['filtering_text'] = None
+            data['filtering_built_in'] = None
+            data['filtering_extension'] = None
+            data['filtering_plugin'] = None
+        
+        # Extract test case links for TestSuiteEntity
+        test_case_links = []
+        if root.tag == "TestSuiteEntity":
+            for link in root.findall('testCaseLink'):
+                link_data = {
+                    'link_guid': _get_text(link, 'guid'),
+                    'test_case_id': _get_text(link, 'testCaseId'),
+                    'is_reuse_driver': _is_true(_get_text(link, 'isReuseDriver')),
+                    'is_run': _is_true(_get_text(link, 'isRun')),
+                    'using_data_binding_at_test_suite_level': _is_true(_get_text(link, 'usingDataBindingAtTestSuiteLevel')),
+                    'variables': []
+                }
+                
+                # Extract variable links
+                for var_link in link.findall('variableLink'):
+                    var_data = {
+                        'variable_id': _get_text(var_link, 'variableId'),
+                        'test_data_link_id': _get_text(var_link, 'testDataLinkId'),
+                        'type': _get_text(var_link, 'type'),
+                        'value': _get_text(var_link, 'value')
+                    }
+                    link_data['variables'].append(var_data)
+                
+                test_case_links.append(link_data)
+        
+        data['test_case_links'] = test_case_links
+        
+        # Extract test suite collection links for TestSuiteCollectionEntity
+        test_suite_collection_links = []
+        if root.tag == "TestSuiteCollectionEntity":
+            for run_config in root.findall('testSuiteRunConfigurations/TestSuiteRunConfiguration'):
+                config_element = run_config.find('configuration')
+                collection_link_data = {
+                    'referenced_suite_path': _get_text(run_config, 'testSuiteEntity'),
+                    'run_enabled': _is_true(_get_text(run_config, 'runEnabled')),
+                    'group_name': _get_text(config_element, 'groupName') if config_element is not None else '',
+                    'profile_name': _get_text(config_element, 'profileName') if config_element is not None else '',
+                    'require_configuration_data': _is_true(_get_text(config_element, 'requireConfigurationData')) if config_element is not None else False,
+                    'run_configuration_id': _get_text(config_element, 'runConfigurationId') if config_element is not None else ''
+                }
+                test_suite_collection_links.append(collection_link_data)
+        
+        data['test_suite_collection_links'] = test_suite_collection_links
+        
+        return data, None
+        
+    except ET.ParseError as e:
+        return None, f"Error parsing {file_path}: {e}"
+    except Exception as e:
+        return None, f"Unexpected error parsing {file_path}: {e}"
 
 
 class TestSuiteExtractor:
-    def __init__(self, root_dir, db_path="katalon_project.db"):
+    def __init__(self, root_dir, db_path="katalon_project.db", force=False, verbose=False):
         self.root_dir = Path(root_dir)
         self.db_path = db_path
+        self.force = force  # Re-parse every .ts file even when its modification time is unchanged
+        self.verbose = verbose  # Print every processed file instead of periodic progress
         self.conn = None
+        self._test_case_ids_by_path = None  # relative_path -> test_cases.id, loaded on first use
+        self._cleared_suite_ids = set()  # Existing suites whose related rows were already cleared this run
+        self._known_tag_names = None  # Every test case tag name, loaded on first use
         
     def create_database(self):
         """Create SQLite database and tables for test suite data.
         If test case tables exist, this will add test suite tables to the same database."""
-        self.conn = sqlite3.connect(self.db_path)
+        # Autocommit mode: the only write transaction is the explicit one in extract_all
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=256)
         cursor = self.conn.cursor()
         
+        # Bulk-load settings for a one-shot, single-writer extraction (same as tc_extractor.py).
+        # The database can always be rebuilt from the project files, so syncs are skipped entirely;
+        # the rollback journal stays in memory rather than switching the file to WAL
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA cache_size=-200000")  # ~200 MB
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        
         # Check if test_cases table exists (from tc_extractor.py)
         cursor.execute('''
             SELECT name FROM sqlite_master 
@@ -143,161 +394,57 @@ class TestSuiteExtractor:
             )
         ''')
         
-        # Create indexes for better performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_test_suites_guid ON test_suites(test_suite_guid)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_test_suites_type ON test_suites(suite_type)')
+        # The suite link lookup is needed while suites are written (link ID read-back and the
+        # DELETEs for updated suites); every other index is built by create_indexes after the load
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_test_suite_case_links_suite_id ON test_suite_case_links(test_suite_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_test_suite_case_links_test_case_id ON test_suite_case_links(test_case_id)')
+        if has_test_cases:
+            # Dynamic Test Suite tag criteria look up test cases by tag
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_test_case_tags_tag_id ON test_case_tags(tag_id, test_case_id)')
         
-        self.conn.commit()
         print(f"Database created: {self.db_path}")
     
+    def create_indexes(self):
+        """Create the read-side indexes once the suites are loaded.
+        
+        Building them over the finished tables is cheaper than maintaining them row by row
+        during the bulk insert. Existing indexes are left as they are.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_test_suites_guid ON test_suites(test_suite_guid)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_test_suites_type ON test_suites(suite_type)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_test_suite_case_links_test_case_id ON test_suite_case_links(test_case_id)')
+        # Covering indexes for the read-only browser, which cannot create them itself
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_test_suite_case_links_case_suite ON test_suite_case_links(test_case_db_id, test_suite_id)')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_test_suites_type_filtering_text ON test_suites(suite_type, filtering_text) "
+                       "WHERE filtering_text IS NOT NULL AND filtering_text != ''")
+    
     def find_ts_files(self):
-        """Find all .ts files in the Test Suites directory."""
+        """Find all .ts files in the Test Suites directory.
+        
+        Returns:
+            list: (file_path, relative_path, mtime) tuples
+        """
         test_suites_dir = self.root_dir / "Test Suites"
         if not test_suites_dir.exists():
             raise FileNotFoundError(f"Test Suites directory not found: {test_suites_dir}")
         
-        ts_files = list(test_suites_dir.rglob("*.ts"))
+        ts_files = list(_walk_ts_files(str(test_suites_dir), "Test Suites"))
         print(f"Found {len(ts_files)} .ts files")
         return ts_files
     
     def parse_ts_file(self, file_path):
         """Parse a single .ts file and extract TestSuiteEntity, FilteringTestSuiteEntity, or TestSuiteCollectionEntity data."""
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            if root.tag not in ["TestSuiteEntity", "FilteringTestSuiteEntity", "TestSuiteCollectionEntity"]:
-                print(f"Warning: {file_path} is not a TestSuiteEntity, FilteringTestSuiteEntity, or TestSuiteCollectionEntity file")
-                return None
-            
-            # Extract file metadata
-            file_stat = file_path.stat()
-            updated_at = datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Map suite types to UI-friendly aliases
-            suite_type_mapping = {
-                'TestSuiteEntity': 'Test Suite',
-                'FilteringTestSuiteEntity': 'Dynamic Test Suite',
-                'TestSuiteCollectionEntity': 'Test Suite Collection'
-            }
-            
-            # Extract basic fields (common to all types)
-            data = {
-                'name': self.get_text(root, 'name'),
-                'description': self.get_text(root, 'description'),
-                'tags': self.get_text(root, 'tag'),
-                'suite_type': root.tag,
-                'suite_type_alias': suite_type_mapping.get(root.tag, root.tag),
-                'relative_path': str(file_path.relative_to(self.root_dir)),
-                'updated_at': updated_at
-            }
-            
-            # Handle testSuiteGuid - TestSuiteCollectionEntity files don't have this field
-            if root.tag == "TestSuiteCollectionEntity":
-                # Generate a unique identifier for TestSuiteCollectionEntity based on file path
-                import hashlib
-                file_hash = hashlib.md5(str(file_path).encode()).hexdigest()[:8]
-                data['test_suite_guid'] = f"collection_{file_hash}"
-            else:
-                data['test_suite_guid'] = self.get_text(root, 'testSuiteGuid')
-            
-            # Extract type-specific fields
-            if root.tag in ["TestSuiteEntity", "FilteringTestSuiteEntity"]:
-                # Fields specific to TestSuiteEntity and FilteringTestSuiteEntity
-                data.update({
-                    'is_rerun': self.get_text(root, 'isRerun').lower() == 'true',
-                    'mail_recipient': self.get_text(root, 'mailRecipient'),
-                    'number_of_rerun': int(self.get_text(root, 'numberOfRerun') or 0),
-                    'page_load_timeout': int(self.get_text(root, 'pageLoadTimeout') or 30),
-                    'page_load_timeout_default': self.get_text(root, 'pageLoadTimeoutDefault').lower() == 'true',
-                    'rerun_failed_test_cases_only': self.get_text(root, 'rerunFailedTestCasesOnly').lower() == 'true',
-                    'rerun_immediately': self.get_text(root, 'rerunImmediately').lower() == 'true'
-                })
-            elif root.tag == "TestSuiteCollectionEntity":
-                # Fields specific to TestSuiteCollectionEntity
-                data.update({
-                    'delay_between_instances': int(self.get_text(root, 'delayBetweenInstances') or 0),
-                    'execution_mode': self.get_text(root, 'executionMode'),
-                    'max_concurrent_instances': int(self.get_text(root, 'maxConcurrentInstances') or 1)
-                })
-            
-            # Process tags
-            tags_list = []
-            if data['tags']:
-                tags_list = [tag.strip() for tag in data['tags'].split(',') if tag.strip()]
-            data['tags_list'] = json.dumps(tags_list)
-            
-            # Extract filtering-specific fields for FilteringTestSuiteEntity
-            if root.tag == "FilteringTestSuiteEntity":
-                data['filtering_text'] = self.get_text(root, 'filteringText')
-                data['filtering_built_in'] = self.get_text(root, 'filteringBuiltIn')
-                data['filtering_extension'] = self.get_text(root, 'filteringExtension')
-                data['filtering_plugin'] = self.get_text(root, 'filteringPlugin')
-            else:
-                data['filtering_text'] = None
-                data['filtering_built_in'] = None
-                data['filtering_extension'] = None
-                data['filtering_plugin'] = None
-            
-            # Extract test case links for TestSuiteEntity
-            test_case_links = []
-            if root.tag == "TestSuiteEntity":
-                for link in root.findall('testCaseLink'):
-                    link_data = {
-                        'link_guid': self.get_text(link, 'guid'),
-                        'test_case_id': self.get_text(link, 'testCaseId'),
-                        'is_reuse_driver': self.get_text(link, 'isReuseDriver').lower() == 'true',
-                        'is_run': self.get_text(link, 'isRun').lower() == 'true',
-                        'using_data_binding_at_test_suite_level': self.get_text(link, 'usingDataBindingAtTestSuiteLevel').lower() == 'true',
-                        'variables': []
-                    }
-                    
-                    # Extract variable links
-                    for var_link in link.findall('variableLink'):
-                        var_data = {
-                            'variable_id': self.get_text(var_link, 'variableId'),
-                            'test_data_link_id': self.get_text(var_link, 'testDataLinkId'),
-                            'type': self.get_text(var_link, 'type'),
-                            'value': self.get_text(var_link, 'value')
-                        }
-                        link_data['variables'].append(var_data)
-                    
-                    test_case_links.append(link_data)
-            
-            data['test_case_links'] = test_case_links
-            
-            # Extract test suite collection links for TestSuiteCollectionEntity
-            test_suite_collection_links = []
-            if root.tag == "TestSuiteCollectionEntity":
-                for run_config in root.findall('testSuiteRunConfigurations/TestSuiteRunConfiguration'):
-                    config_element = run_config.find('configuration')
-                    collection_link_data = {
-                        'referenced_suite_path': self.get_text(run_config, 'testSuiteEntity'),
-                        'run_enabled': self.get_text(run_config, 'runEnabled').lower() == 'true',
-                        'group_name': self.get_text(config_element, 'groupName') if config_element is not None else '',
-                        'profile_name': self.get_text(config_element, 'profileName') if config_element is not None else '',
-                        'require_configuration_data': self.get_text(config_element, 'requireConfigurationData').lower() == 'true' if config_element is not None else False,
-                        'run_configuration_id': self.get_text(config_element, 'runConfigurationId') if config_element is not None else ''
-                    }
-                    test_suite_collection_links.append(collection_link_data)
-            
-            data['test_suite_collection_links'] = test_suite_collection_links
-            
-            return data
-            
-        except ET.ParseError as e:
-            print(f"Error parsing {file_path}: {e}")
-            return None
-        except Exception as e:
-            print(f"Unexpected error parsing {file_path}: {e}")
-            return None
+        file_path = Path(file_path)
+        data, message = _parse_ts_file(
+            (str(file_path), str(file_path.relative_to(self.root_dir)), file_path.stat().st_mtime)
+        )
+        if message:
+            print(message)
+        return data
     
     def get_text(self, parent, tag_name):
         """Safely get text content from XML element."""
-        element = parent.find(tag_name)
-        return element.text if element is not None and element.text else ""
+        return _get_text(parent, tag_name)
     
     def insert_test_suite(self, data):
         """Insert or update test suite data in database."""
@@ -329,10 +476,19 @@ class TestSuiteExtractor:
                 data['test_suite_guid']
             ))
             
-            # Clear existing related data to avoid duplicates
-            cursor.execute('DELETE FROM test_suite_tags WHERE test_suite_id = ?', (test_suite_id,))
-            cursor.execute('DELETE FROM test_suite_case_links WHERE test_suite_id = ?', (test_suite_id,))
-            cursor.execute('DELETE FROM test_suite_collection_links WHERE collection_suite_id = ?', (test_suite_id,))
+            # Clear existing related data to avoid duplicates, unless the bulk pass in
+            # extract_all already did; a suite seen again in the same run is cleared here
+            if test_suite_id in self._cleared_suite_ids:
+                self._cleared_suite_ids.discard(test_suite_id)
+            else:
+                cursor.execute('''
+                    DELETE FROM test_suite_variables WHERE test_case_link_id IN (
+                        SELECT id FROM test_suite_case_links WHERE test_suite_id = ?
+                    )
+                ''', (test_suite_id,))
+                cursor.execute('DELETE FROM test_suite_tags WHERE test_suite_id = ?', (test_suite_id,))
+                cursor.execute('DELETE FROM test_suite_case_links WHERE test_suite_id = ?', (test_suite_id,))
+                cursor.execute('DELETE FROM test_suite_collection_links WHERE collection_suite_id = ?', (test_suite_id,))
             
         else:
             # Insert new test suite record
@@ -357,65 +513,62 @@ class TestSuiteExtractor:
             test_suite_id = cursor.lastrowid
         
         # Process tags
-        if data['tags']:
-            tags_list = [tag.strip() for tag in data['tags'].split(',') if tag.strip()]
-            for tag in tags_list:
-                # Insert or update tag (only increment count for new test suites)
+        if data['tag_names']:
+            suite_tag_rows = []
+            for tag in data['tag_names']:
+                # Insert the tag if needed; usage counts are recomputed after the load
                 cursor.execute('''
-                    INSERT OR IGNORE INTO suite_tags (tag_name, usage_count) VALUES (?, 1)
+                    INSERT OR IGNORE INTO suite_tags (tag_name) VALUES (?)
                 ''', (tag,))
-                
-                # Only increment usage count if this is a new test suite
-                if not existing_record:
-                    cursor.execute('''
-                        UPDATE suite_tags SET usage_count = usage_count + 1 WHERE tag_name = ?
-                    ''', (tag,))
-                
-                # Get tag ID and create relationship
                 cursor.execute('SELECT id FROM suite_tags WHERE tag_name = ?', (tag,))
-                tag_id = cursor.fetchone()[0]
-                
-                cursor.execute('''
-                    INSERT INTO test_suite_tags (test_suite_id, tag_id) 
-                    VALUES (?, ?)
-                ''', (test_suite_id, tag_id))
+                suite_tag_rows.append((test_suite_id, cursor.fetchone()[0]))
+            
+            cursor.executemany('''
+                INSERT INTO test_suite_tags (test_suite_id, tag_id) 
+                VALUES (?, ?)
+            ''', suite_tag_rows)
         
         # Process test case links (for TestSuiteEntity)
         if data['test_case_links']:
+            test_case_ids_by_path = self._get_test_case_ids_by_path()
+            link_rows = []
             for link in data['test_case_links']:
                 # Try to find the corresponding test case in the test_cases table
                 test_case_db_id = None
                 if link['test_case_id']:
                     # Convert testCaseId path to relative_path format
                     # e.g., "Test Cases/Platform/Admin/..." -> "Test Cases/Platform/Admin/...tc"
-                    relative_path = link['test_case_id'] + '.tc'
-                    cursor.execute('SELECT id FROM test_cases WHERE relative_path = ?', (relative_path,))
-                    result = cursor.fetchone()
-                    if result:
-                        test_case_db_id = result[0]
+                    test_case_db_id = test_case_ids_by_path.get(link['test_case_id'] + '.tc')
                 
-                cursor.execute('''
-                    INSERT INTO test_suite_case_links 
-                    (test_suite_id, link_guid, test_case_id, test_case_db_id, is_reuse_driver, is_run, 
-                     using_data_binding_at_test_suite_level)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                link_rows.append((
                     test_suite_id, link['link_guid'], link['test_case_id'], test_case_db_id,
                     link['is_reuse_driver'], link['is_run'], link['using_data_binding_at_test_suite_level']
                 ))
-                
-                test_case_link_id = cursor.lastrowid
-                
-                # Process variables for this test case link
-                for var in link['variables']:
-                    cursor.execute('''
-                        INSERT INTO test_suite_variables 
-                        (test_case_link_id, variable_id, test_data_link_id, type, value)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        test_case_link_id, var['variable_id'], var['test_data_link_id'],
-                        var['type'], var['value']
-                    ))
+            
+            cursor.executemany('''
+                INSERT INTO test_suite_case_links 
+                (test_suite_id, link_guid, test_case_id, test_case_db_id, is_reuse_driver, is_run, 
+                 using_data_binding_at_test_suite_level)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', link_rows)
+            
+            # The suite's old links are already deleted, so its links in id order are exactly
+            # the rows just inserted, in the same order as data['test_case_links']
+            cursor.execute('''
+                SELECT id FROM test_suite_case_links WHERE test_suite_id = ? ORDER BY id
+            ''', (test_suite_id,))
+            link_ids = [row[0] for row in cursor]
+            
+            # Process variables for every test case link
+            cursor.executemany('''
+                INSERT INTO test_suite_variables 
+                (test_case_link_id, variable_id, test_data_link_id, type, value)
+                VALUES (?, ?, ?, ?, ?)
+            ''', [
+                (test_case_link_id, var['variable_id'], var['test_data_link_id'], var['type'], var['value'])
+                for test_case_link_id, link in zip(link_ids, data['test_case_links'])
+                for var in link['variables']
+            ])
         
         # Process filtering test suites (FilteringTestSuiteEntity) - create links for matching test cases
         elif data['suite_type'] == 'FilteringTestSuiteEntity' and data['filtering_text']:
@@ -423,20 +576,139 @@ class TestSuiteExtractor:
         
         # Process test suite collection links for TestSuiteCollectionEntity
         if data['suite_type'] == 'TestSuiteCollectionEntity':
-            for collection_link in data['test_suite_collection_links']:
-                cursor.execute('''
-                    INSERT INTO test_suite_collection_links 
-                    (collection_suite_id, referenced_suite_path, run_enabled, group_name, 
-                     profile_name, require_configuration_data, run_configuration_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+            cursor.executemany('''
+                INSERT INTO test_suite_collection_links 
+                (collection_suite_id, referenced_suite_path, run_enabled, group_name, 
+                 profile_name, require_configuration_data, run_configuration_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (
                     test_suite_id, collection_link['referenced_suite_path'], collection_link['run_enabled'],
                     collection_link['group_name'], collection_link['profile_name'], 
                     collection_link['require_configuration_data'], collection_link['run_configuration_id']
-                ))
+                )
+                for collection_link in data['test_suite_collection_links']
+            ])
         
         return existing_record is not None
     
+    def _get_test_case_ids_by_path(self):
+        """Map test case relative paths to test_cases IDs, loading them once per run.
+        
+        Returns:
+            dict: relative_path -> test case ID (empty when there is no test_cases table)
+        """
+        if self._test_case_ids_by_path is not None:
+            return self._test_case_ids_by_path
+        
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name='test_cases'
+        ''')
+        if not cursor.fetchone():
+            self._test_case_ids_by_path = {}
+            return self._test_case_ids_by_path
+        
+        # Descending IDs, so a path stored more than once keeps its lowest ID as a lookup would
+        cursor.execute('SELECT relative_path, id FROM test_cases ORDER BY id DESC')
+        self._test_case_ids_by_path = dict(cursor)
+        return self._test_case_ids_by_path
+    
+    def _get_known_tag_names(self):
+        """Return the tag names carried by any test case, loading them once per run.
+        
+        Returns:
+            frozenset: tag names folded with _NOCASE_FOLD (empty when there is no tags table)
+        """
+        if self._known_tag_names is not None:
+            return self._known_tag_names
+        
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name='tags'
+        ''')
+        if not cursor.fetchone():
+            self._known_tag_names = frozenset()
+            return self._known_tag_names
+        
+        cursor.execute('SELECT tag_name FROM tags')
+        self._known_tag_names = frozenset(row[0].translate(_NOCASE_FOLD) for row in cursor)
+        return self._known_tag_names
+    
+    def _get_unchanged_candidates(self):
+        """Map suite relative paths to their stored modification times.
+        
+        Dynamic Test Suites are left out because their links depend on the test case data,
+        so they are re-evaluated on every run.
+        
+        Returns:
+            dict: relative_path -> updated_at for static suites and collections
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT relative_path, updated_at FROM test_suites
+            WHERE suite_type != 'FilteringTestSuiteEntity'
+        ''')
+        return dict(cursor)
+    
+    def _clear_related_rows(self, suite_guids):
+        """Delete the tags, links and variables of the stored suites with the given GUIDs.
+        
+        One DELETE per table replaces the per-suite DELETEs insert_test_suite would otherwise
+        issue for every updated suite.
+        
+        Args:
+            suite_guids (list): GUIDs of the parsed suites about to be written
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('CREATE TEMP TABLE reparsed_suites (id INTEGER PRIMARY KEY)')
+        cursor.execute('CREATE TEMP TABLE reparsed_guids (test_suite_guid TEXT PRIMARY KEY)')
+        cursor.executemany('INSERT OR IGNORE INTO reparsed_guids VALUES (?)', ((guid,) for guid in suite_guids))
+        cursor.execute('''
+            INSERT INTO reparsed_suites
+            SELECT id FROM test_suites WHERE test_suite_guid IN (SELECT test_suite_guid FROM reparsed_guids)
+        ''')
+        
+        cursor.execute('''
+            DELETE FROM test_suite_variables WHERE test_case_link_id IN (
+                SELECT id FROM test_suite_case_links WHERE test_suite_id IN (SELECT id FROM reparsed_suites)
+            )
+        ''')
+        cursor.execute('DELETE FROM test_suite_tags WHERE test_suite_id IN (SELECT id FROM reparsed_suites)')
+        cursor.execute('DELETE FROM test_suite_case_links WHERE test_suite_id IN (SELECT id FROM reparsed_suites)')
+        cursor.execute('DELETE FROM test_suite_collection_links WHERE collection_suite_id IN (SELECT id FROM reparsed_suites)')
+        
+        cursor.execute('SELECT id FROM reparsed_suites')
+        self._cleared_suite_ids = {row[0] for row in cursor}
+        cursor.execute('DROP TABLE reparsed_suites')
+        cursor.execute('DROP TABLE reparsed_guids')
+    
+    def _refresh_test_case_db_ids(self):
+        """Re-resolve test_case_db_id for static suite links against the current test_cases table.
+        
+        Links of skipped suites were written by an earlier run, and test cases extracted since
+        then may now match them.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name='test_cases'
+        ''')
+        if not cursor.fetchone():
+            return
+        
+        cursor.execute('''
+            UPDATE test_suite_case_links
+            SET test_case_db_id = (
+                SELECT MIN(tc.id) FROM test_cases tc
+                WHERE tc.relative_path = test_suite_case_links.test_case_id || '.tc'
+            )
+            WHERE test_case_id != ''
+              AND test_suite_id IN (SELECT id FROM test_suites WHERE suite_type = 'TestSuiteEntity')
+        ''')
+    
     def _create_filtering_test_suite_links(self, test_suite_id, filtering_text):
         """
         Create test_suite_case_links entries for FilteringTestSuiteEntity based on filtering criteria.
@@ -445,6 +717,11 @@ class TestSuiteExtractor:
             test_suite_id (int): ID of the test suite
             filtering_text (str): Filtering criteria text
         """
+        # Parse filtering criteria first; suites without any skip the database entirely
+        filtering_criteria = self.parse_filtering_criteria(filtering_text)
+        if not filtering_criteria:
+            return
+        
         cursor = self.conn.cursor()
         
         # Check if test_cases table exists
@@ -455,67 +732,31 @@ class TestSuiteExtractor:
         if not cursor.fetchone():
             return  # No test cases to link to
         
-        # Parse filtering criteria
-        filtering_criteria = self.parse_filtering_criteria(filtering_text)
-        if not filtering_criteria:
-            return
-        
         # Build WHERE clause to find matching test cases
-        where_conditions = []
-        params = []
-        
-        # Handle name criteria (usually prefix matching)
-        if 'name' in filtering_criteria:
-            name_conditions = []
-            for name_pattern in filtering_criteria['name']:
-                if name_pattern:
-                    name_conditions.append("name LIKE ?")
-                    params.append(f"{name_pattern}%")
-            
-            if name_conditions:
-                where_conditions.append(f"({' OR '.join(name_conditions)})")
-        
-        # Handle tag criteria (must contain all specified tags)
-        if 'tag' in filtering_criteria:
-            tag_conditions = []
-            for tag in filtering_criteria['tag']:
-                if tag:
-                    tag_conditions.append("(tags LIKE ? OR tags LIKE ? OR tags LIKE ? OR tags = ?)")
-                    # Handle tag at beginning, middle, end, or as only tag
-                    params.extend([f"{tag},%", f"%,{tag},%", f"%,{tag}", tag])
-            
-            if tag_conditions:
-                where_conditions.append(f"({' AND '.join(tag_conditions)})")
-        
-        if not where_conditions:
+        where_clause, params = self._build_filtering_where_clause(filtering_criteria)
+        if not where_clause:
             return
         
         # Find matching test cases
-        query = f"SELECT id, name, relative_path FROM test_cases WHERE {' AND '.join(where_conditions)}"
+        query = f"SELECT id, relative_path FROM test_cases WHERE {where_clause}"
         cursor.execute(query, params)
         matching_test_cases = cursor.fetchall()
         
-        # Create test_suite_case_links entries for each matching test case
-        for test_case in matching_test_cases:
-            test_case_db_id = test_case[0]
-            test_case_name = test_case[1]
-            relative_path = test_case[2]
-            
-            # Convert relative_path back to test_case_id format (remove .tc extension)
-            test_case_id = relative_path[:-3] if relative_path.endswith('.tc') else relative_path
-            
-            # Create a synthetic link_guid for filtering-based links
-            link_guid = f"filtering_{test_suite_id}_{test_case_db_id}"
-            
-            cursor.execute('''
-                INSERT INTO test_suite_case_links 
-                (test_suite_id, link_guid, test_case_id, test_case_db_id, is_reuse_driver, is_run, 
-                 using_data_binding_at_test_suite_level)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                test_suite_id, link_guid, test_case_id, test_case_db_id,
+        # Create test_suite_case_links entries for all matching test cases in one executemany.
+        # test_case_id is the relative_path without its .tc extension, and link_guid is synthetic
+        cursor.executemany('''
+            INSERT INTO test_suite_case_links 
+            (test_suite_id, link_guid, test_case_id, test_case_db_id, is_reuse_driver, is_run, 
+             using_data_binding_at_test_suite_level)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (
+                test_suite_id, f"filtering_{test_suite_id}_{test_case_db_id}",
+                relative_path[:-3] if relative_path.endswith('.tc') else relative_path, test_case_db_id,
                 False, True, False  # Default values for filtering-based links
-            ))
+            )
+            for test_case_db_id, relative_path in matching_test_cases
+        ])
     
     def parse_filtering_criteria(self, filtering_text):
         """
@@ -524,16 +765,13 @@ class TestSuiteExtractor:
         Example: "name=(AC-) tag=(api,) " 
         Returns: {'name': ['AC-'], 'tag': ['api']}
         """
-        if not filtering_text:
+        # Every criterion is written as key=(...), so text without "=(" has none to find
+        if not filtering_text or '=(' not in filtering_text:
             return {}
         
         criteria = {}
         
-        # Pattern to match name=(value) or tag=(value1,value2)
-        pattern = r'(\w+)=\(([^)]*)\)'
-        matches = re.findall(pattern, filtering_text)
-        
-        for key, value in matches:
+        for key, value in _FILTERING_CRITERIA_RE.findall(filtering_text):
             if value:
                 # Split by comma and clean up values
                 values = [v.strip() for v in value.split(',') if v.strip()]
@@ -541,6 +779,39 @@ class TestSuiteExtractor:
         
         return criteria
     
+    def _build_filtering_where_clause(self, filtering_criteria):
+        """
+        Build the test_cases WHERE clause for parsed filtering criteria.
+        
+        Tag criteria are matched case-insensitively (like the report) against the normalized
+        tags/test_case_tags tables, so tag lookups use the link table's index instead of
+        scanning every test case's tag string.
+        
+        Args:
+            filtering_criteria (dict): Parsed criteria from filteringText
+            
+        Returns:
+            tuple: (where_clause, params); where_clause is None when no criteria apply or
+                   no test case can match
+        """
+        # Handle name criteria (usually prefix matching)
+        name_patterns = [pattern for pattern in filtering_criteria.get('name', []) if pattern]
+        # Handle tag criteria (must contain all specified tags, compared case-insensitively)
+        tags = list(dict.fromkeys(tag.translate(_NOCASE_FOLD) for tag in filtering_criteria.get('tag', []) if tag))
+        if not name_patterns and not tags:
+            return None, []
+        
+        # A tag no test case carries rules out every test case, so there is nothing to query
+        if tags and not self._get_known_tag_names().issuperset(tags):
+            return None, []
+        
+        params = [f"{pattern}%" for pattern in name_patterns]
+        if tags:
+            params.extend(tags)
+            params.append(len(tags))
+        
+        return _filtering_where_template(len(name_patterns), len(tags)), params
+    
     def count_matching_test_cases(self, filtering_criteria):
         """
         Count how many test cases match the filtering criteria.
@@ -557,37 +828,12 @@ class TestSuiteExtractor:
         cursor = self.conn.cursor()
         
         # Build WHERE clause based on criteria
-        where_conditions = []
-        params = []
-        
-        # Handle name criteria (usually prefix matching)
-        if 'name' in filtering_criteria:
-            name_conditions = []
-            for name_pattern in filtering_criteria['name']:
-                if name_pattern:
-                    name_conditions.append("name LIKE ?")
-                    params.append(f"{name_pattern}%")
-            
-            if name_conditions:
-                where_conditions.append(f"({' OR '.join(name_conditions)})")
-        
-        # Handle tag criteria (must contain all specified tags)
-        if 'tag' in filtering_criteria:
-            tag_conditions = []
-            for tag in filtering_criteria['tag']:
-                if tag:
-                    tag_conditions.append("(tags LIKE ? OR tags LIKE ? OR tags LIKE ? OR tags = ?)")
-                    # Handle tag at beginning, middle, end, or as only tag
-                    params.extend([f"{tag},%", f"%,{tag},%", f"%,{tag}", tag])
-            
-            if tag_conditions:
-                where_conditions.append(f"({' AND '.join(tag_conditions)})")
-        
-        if not where_conditions:
+        where_clause, params = self._build_filtering_where_clause(filtering_criteria)
+        if not where_clause:
             return 0
         
         # Execute query
-        query = f"SELECT COUNT(*) FROM test_cases WHERE {' AND '.join(where_conditions)}"
+        query = f"SELECT COUNT(*) FROM test_cases WHERE {where_clause}"
         cursor.execute(query, params)
         return cursor.fetchone()[0]
     
@@ -610,13 +856,17 @@ class TestSuiteExtractor:
         print("FILTERING TEST SUITE ANALYSIS")
         print("="*60)
         
-        # Get all FilteringTestSuiteEntity test suites
+        # Get all FilteringTestSuiteEntity test suites with their match counts. Every matching
+        # test case was linked to its Dynamic Test Suite when the suite was written, so the link
+        # counts are the match counts and nothing has to be counted again
         cursor.execute('''
-            SELECT name, filtering_text, relative_path 
-            FROM test_suites 
-            WHERE suite_type = 'FilteringTestSuiteEntity' 
-            AND filtering_text IS NOT NULL AND filtering_text != ''
-            ORDER BY name
+            SELECT ts.name, ts.filtering_text, ts.relative_path, COUNT(l.id)
+            FROM test_suites ts
+            LEFT JOIN test_suite_case_links l ON l.test_suite_id = ts.id
+            WHERE ts.suite_type = 'FilteringTestSuiteEntity' 
+            AND ts.filtering_text IS NOT NULL AND ts.filtering_text != ''
+            GROUP BY ts.id
+            ORDER BY ts.name, ts.id
         ''')
         
         filtering_suites = cursor.fetchall()
@@ -625,26 +875,33 @@ class TestSuiteExtractor:
             print("No FilteringTestSuiteEntity with filtering criteria found")
             return
         
+        
         total_matches = 0
+        # Suites often share a filtering text; each distinct one is parsed and its examples
+        # fetched once. filtering_text -> (criteria, examples)
+        analysis_by_filtering_text = {}
         
-        for suite_name, filtering_text, relative_path in filtering_suites:
+        for suite_name, filtering_text, relative_path, match_count in filtering_suites:
             print(f"\n📋 **{suite_name}**")
             print(f"   Path: {relative_path}")
             print(f"   Filtering Text: {filtering_text}")
             
-            # Parse criteria
-            criteria = self.parse_filtering_criteria(filtering_text)
+            analysis = analysis_by_filtering_text.get(filtering_text)
+            if analysis is None:
+                criteria = self.parse_filtering_criteria(filtering_text)
+                examples = []
+                if criteria and match_count > 0 and match_count <= 5:
+                    examples = self.get_matching_test_cases_examples(criteria, limit=5)
+                analysis = analysis_by_filtering_text[filtering_text] = (criteria, examples)
+            criteria, examples = analysis
             print(f"   Parsed Criteria: {criteria}")
             
-            # Count matching test cases
             if criteria:
-                match_count = self.count_matching_test_cases(criteria)
                 total_matches += match_count
                 print(f"   ✅ **Matching Test Cases: {match_count}**")
                 
                 # Show some example matches if there are any
                 if match_count > 0 and match_count <= 5:
-                    examples = self.get_matching_test_cases_examples(criteria, limit=5)
                     if examples:
                         print(f"   Examples:")
                         for example in examples:
@@ -665,37 +922,15 @@ class TestSuiteExtractor:
         cursor = self.conn.cursor()
         
         # Build WHERE clause (same logic as count_matching_test_cases)
-        where_conditions = []
-        params = []
-        
-        if 'name' in filtering_criteria:
-            name_conditions = []
-            for name_pattern in filtering_criteria['name']:
-                if name_pattern:
-                    name_conditions.append("name LIKE ?")
-                    params.append(f"{name_pattern}%")
-            
-            if name_conditions:
-                where_conditions.append(f"({' OR '.join(name_conditions)})")
-        
-        if 'tag' in filtering_criteria:
-            tag_conditions = []
-            for tag in filtering_criteria['tag']:
-                if tag:
-                    tag_conditions.append("(tags LIKE ? OR tags LIKE ? OR tags LIKE ? OR tags = ?)")
-                    params.extend([f"{tag},%", f"%,{tag},%", f"%,{tag}", tag])
-            
-            if tag_conditions:
-                where_conditions.append(f"({' AND '.join(tag_conditions)})")
-        
-        if not where_conditions:
+        where_clause, params = self._build_filtering_where_clause(filtering_criteria)
+        if not where_clause:
             return []
         
         # Execute query
-        query = f"SELECT name FROM test_cases WHERE {' AND '.join(where_conditions)} LIMIT ?"
+        query = f"SELECT name FROM test_cases WHERE {where_clause} LIMIT ?"
         params.append(limit)
         cursor.execute(query, params)
-        return [row[0] for row in cursor.fetchall()]
+        return [row[0] for row in cursor]
     
     def get_directory_distribution(self, depth=2, base_path="Test Suites"):
         """
@@ -709,37 +944,43 @@ class TestSuiteExtractor:
             list: Sorted list of (directory_path, count) tuples
         """
         cursor = self.conn.cursor()
-        cursor.execute('SELECT relative_path FROM test_suites')
-        paths = cursor.fetchall()
-        
-        directory_counts = {}
-        base_path_with_slash = f"{base_path}/"
-        base_path_len = len(base_path_with_slash)
-        
-        for (path,) in paths:
-            if path.startswith(base_path_with_slash):
-                # Remove base path prefix and split by '/'
-                remaining_path = path[base_path_len:]
-                parts = remaining_path.split('/')
-                
-                # Build directory path based on requested depth
-                if len(parts) >= depth:
-                    # Take exactly 'depth' levels
-                    directory_parts = parts[:depth]
-                    directory = f"{base_path}/" + "/".join(directory_parts)
-                elif len(parts) > 0:
-                    # Take all available parts if less than requested depth
-                    directory = f"{base_path}/" + "/".join(parts[:-1]) if len(parts) > 1 else f"{base_path}/{parts[0]}"
-                else:
-                    directory = base_path
-                
-                directory_counts[directory] = directory_counts.get(directory, 0) + 1
-            else:
-                # Handle paths that don't start with base_path
-                directory_counts[path] = directory_counts.get(path, 0) + 1
         
-        # Sort by count descending
-        return sorted(directory_counts.items(), key=lambda x: x[1], reverse=True)
+        # Walk each path below base_path one directory at a time (at most 'depth' steps) and group
+        # on the resulting directory in SQLite. A path that runs out of directories before 'depth'
+        # keeps its file name when it is exactly one level short, like the slice it replaces.
+        cursor.execute('''
+            WITH RECURSIVE walk(id, dir, rest, levels) AS (
+                SELECT id, '', substr(relative_path, length(:prefix) + 1), 0
+                FROM test_suites
+                WHERE substr(relative_path, 1, length(:prefix)) = :prefix
+                UNION ALL
+                SELECT id, dir || '/' || substr(rest, 1, instr(rest, '/') - 1),
+                       substr(rest, instr(rest, '/') + 1), levels + 1
+                FROM walk
+                WHERE levels < :depth AND instr(rest, '/') > 0
+            ),
+            directories(id, directory) AS (
+                SELECT id,
+                    CASE
+                        WHEN levels = :depth THEN :base || dir
+                        WHEN levels = :depth - 1 OR levels = 0 THEN :base || dir || '/' || rest
+                        ELSE :base || dir
+                    END
+                FROM walk
+                WHERE levels = :depth OR instr(rest, '/') = 0
+                UNION ALL
+                SELECT id, relative_path
+                FROM test_suites
+                WHERE substr(relative_path, 1, length(:prefix)) != :prefix
+            )
+            SELECT directory, COUNT(*) as count
+            FROM directories
+            GROUP BY directory
+            ORDER BY count DESC, MIN(id)
+        ''', {'base': base_path, 'prefix': f"{base_path}/", 'depth': depth})
+        
+        # Sorted by count descending
+        return cursor.fetchall()
     
     def extract_all(self):
         """Extract all test suites and store in database."""
@@ -748,35 +989,74 @@ class TestSuiteExtractor:
         # Create database
         self.create_database()
         
-        # Find all .ts files
+        # Find all .ts files, leaving out those whose modification time matches the stored one
         ts_files = self.find_ts_files()
-        
-        # Process each file
+        unchanged = 0
+        if not self.force:
+            known_mtimes = self._get_unchanged_candidates()
+            if known_mtimes:
+                changed_files = [
+                    ts_file for ts_file in ts_files
+                    if known_mtimes.get(ts_file[1]) != _format_mtime(int(ts_file[2]))
+                ]
+                unchanged = len(ts_files) - len(changed_files)
+                ts_files = changed_files
+        
+        # Process each file; every suite is written inside one transaction
         processed = 0
         updated = 0
         errors = 0
         
-        for file_path in ts_files:
-            print(f"Processing: {file_path.relative_to(self.root_dir)}")
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            if unchanged:
+                self._refresh_test_case_db_ids()
+            # XML parsing fans out across CPUs; results come back in file order and all SQLite
+            # writes stay in this process
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_parse_ts_file, ts_files, chunksize=PARSE_CHUNK_SIZE))
             
-            data = self.parse_ts_file(file_path)
-            if data:
-                try:
-                    is_update = self.insert_test_suite(data)
-                    if is_update:
-                        updated += 1
-                    else:
-                        processed += 1
-                except Exception as e:
-                    print(f"Error inserting {file_path}: {e}")
+            # Clear the related rows of every suite about to be updated in one pass
+            self._clear_related_rows([data['test_suite_guid'] for data, _ in results if data])
+            
+            for count, ((file_path, relative_path, _), (data, message)) in enumerate(zip(ts_files, results), 1):
+                if self.verbose:
+                    print(f"Processing: {relative_path}")
+                elif count % PROGRESS_INTERVAL == 0 or count == len(ts_files):
+                    print(f"Processed {count}/{len(ts_files)} files")
+                if message:
+                    print(message)
+                
+                if data:
+                    try:
+                        is_update = self.insert_test_suite(data)
+                        if is_update:
+                            updated += 1
+                        else:
+                            processed += 1
+                    except Exception as e:
+                        print(f"Error inserting {file_path}: {e}")
+                        errors += 1
+                else:
                     errors += 1
-            else:
-                errors += 1
-        
-        self.conn.commit()
+            
+            # Count tag usage once from the relationship table instead of incrementing per test suite
+            self.conn.execute('''
+                UPDATE suite_tags SET usage_count = (
+                    SELECT COUNT(*) FROM test_suite_tags WHERE tag_id = suite_tags.id
+                )
+            ''')
+            
+            self.create_indexes()
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
         print(f"\nExtraction complete!")
         print(f"New records: {processed} files")
         print(f"Updated records: {updated} files")
+        if unchanged:
+            print(f"Unchanged records: {unchanged} files (use --force to re-parse them)")
         print(f"Errors: {errors} files")
         
         # Generate summary statistics
@@ -790,9 +1070,18 @@ class TestSuiteExtractor:
         print("TEST SUITE EXTRACTION SUMMARY")
         print("="*50)
         
+        # Every scalar count of the summary in one statement
+        cursor.execute('''
+            SELECT
+                (SELECT COUNT(*) FROM test_suites),
+                (SELECT COUNT(*) FROM suite_tags),
+                (SELECT COUNT(*) FROM test_suite_case_links),
+                (SELECT COUNT(test_case_db_id) FROM test_suite_case_links)
+        ''')
+        total_suites, total_tags, total_links, linked_cases = cursor.fetchone()
+        unlinked_cases = total_links - linked_cases
+        
         # Total test suites
-        cursor.execute("SELECT COUNT(*) FROM test_suites")
-        total_suites = cursor.fetchone()[0]
         print(f"Total test suites: {total_suites}")
         
         # Test suites by type
@@ -807,13 +1096,11 @@ class TestSuiteExtractor:
             'FilteringTestSuiteEntity': 'Dynamic Test Suite', 
             'TestSuiteCollectionEntity': 'Test Suite Collection'
         }
-        for suite_type, count in cursor.fetchall():
+        for suite_type, count in cursor:
             friendly_name = type_mapping.get(suite_type, suite_type)
             print(f"  {friendly_name}: {count}")
         
         # Total unique tags
-        cursor.execute("SELECT COUNT(*) FROM suite_tags")
-        total_tags = cursor.fetchone()[0]
         print(f"\nTotal unique tags: {total_tags}")
         
         # Top 10 most used tags
@@ -825,12 +1112,10 @@ class TestSuiteExtractor:
                 ORDER BY usage_count DESC 
                 LIMIT 10
             ''')
-            for tag, count in cursor.fetchall():
+            for tag, count in cursor:
                 print(f"  {tag}: {count}")
         
         # Test case links statistics
-        cursor.execute("SELECT COUNT(*) FROM test_suite_case_links")
-        total_links = cursor.fetchone()[0]
         print(f"\nTotal test case links: {total_links}")
         
         # Relationship statistics (if test_cases table exists)
@@ -839,16 +1124,6 @@ class TestSuiteExtractor:
             WHERE type='table' AND name='test_cases'
         ''')
         if cursor.fetchone():
-            cursor.execute('''
-                SELECT COUNT(*) FROM test_suite_case_links 
-                WHERE test_case_db_id IS NOT NULL
-            ''')
-            linked_cases = cursor.fetchone()[0]
-            cursor.execute('''
-                SELECT COUNT(*) FROM test_suite_case_links 
-                WHERE test_case_db_id IS NULL
-            ''')
-            unlinked_cases = cursor.fetchone()[0]
             print(f"Test case relationships:")
             print(f"  Linked to test_cases table: {linked_cases}")
             print(f"  Unlinked (missing test cases): {unlinked_cases}")
@@ -884,6 +1159,16 @@ def main():
         default=None,
         help="Path for the output SQLite database (default: <project_folder_name>.db - same as tc_extractor.py)"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-parse every .ts file, including those whose modification time is unchanged since the last run"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print every processed file instead of periodic progress"
+    )
     
     args = parser.parse_args()
     
@@ -908,7 +1193,7 @@ def main():
         sys.exit(1)
     
     # Create extractor and run
-    extractor = TestSuiteExtractor(project_path, db_name)
+    extractor = TestSuiteExtractor(project_path, db_name, force=args.force, verbose=args.verbose)
     
     try:
         extractor.extract_all()